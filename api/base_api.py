@@ -1,26 +1,73 @@
+import asyncio
+import hashlib
 import logging
+import random
 import sys
 
-from aiohttp import ClientSession
+from aiohttp import ClientConnectionError, ClientPayloadError, ClientResponseError, ClientSession, ClientTimeout
 
-from helpers.consts import API_BASE
+from helpers.circuit_breaker import CircuitBreaker
+from helpers.consts import (
+    API_BASE,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_REQUEST_TIMEOUT,
+    MAX_RATE_LIMIT_RETRIES,
+    REQUEST_TIMEOUTS,
+    RETRY_POLICY
+)
 from helpers.enums import Endpoint
+from helpers.errors import IncompleteDataError
+from helpers.rate_limiter import RateLimiter
+from managers.response_cache import ResponseCache
 
 _LOGGER = logging.getLogger(__name__)
 
 
 class BaseAPI:
-    def __init__(self, token: str, session: ClientSession | None):
-        self._token = token
+    def __init__(
+            self,
+            token: str,
+            session: ClientSession | None,
+            max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+            rate_limiter: RateLimiter | None = None,
+            retry_policy: dict | None = None,
+            circuit_breaker_settings: dict | None = None,
+            response_cache: ResponseCache | None = None,
+            request_timeouts: dict[str, dict] | None = None
+    ):
+        request_timeouts = REQUEST_TIMEOUTS if request_timeouts is None else request_timeouts
+
+        self._token: str | None = None
         self._data: dict | list | None = None
         self._session: ClientSession | None = session
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._rate_limiter = RateLimiter() if rate_limiter is None else rate_limiter
+        self._retry_policy = RETRY_POLICY if retry_policy is None else retry_policy
+        self._circuit_breaker = CircuitBreaker(str(self.endpoint), circuit_breaker_settings)
+        self._response_cache: ResponseCache | None = response_cache
+        self._timeout = ClientTimeout(**request_timeouts.get(self.endpoint, DEFAULT_REQUEST_TIMEOUT))
+        self._account_key: str | None = None
+        self._headers: dict[str, str] = {}
+
+        self._requests = 0
+        self._retries = 0
+        self._not_modified = 0
 
-        self._headers = {"Authorization": "Bearer " + self._token}
+        self.set_token(token)
 
     @property
     def endpoint(self) -> Endpoint | None:
         return None
 
+    @property
+    def account_key(self) -> str:
+        return self._account_key
+
+    def set_token(self, token: str):
+        self._token = token
+        self._account_key = self.get_account_key(token)
+        self._headers = {"Authorization": "Bearer " + token}
+
     async def load(self):
         _LOGGER.info(f"Importing {self.endpoint} data")
 
@@ -29,37 +76,49 @@ class BaseAPI:
     async def _load(self) -> list | dict:
         pass
 
-    async def _get_metadata(self):
-        result = None
+    async def _get_metadata(self, use_cache: bool = False) -> list:
+        result = [
+            item
+            async for item in self._iterate_metadata(use_cache)
+        ]
+
+        return result
+
+    async def _iterate_metadata(self, use_cache: bool = False):
         url = f"{API_BASE}{self.endpoint}"
 
+        page_request = asyncio.ensure_future(self._get_url(url, use_cache))
+
         try:
-            async with self._session.request("get", url, headers=self._headers) as resp:
-                resp.raise_for_status()
+            while page_request is not None:
+                page = await page_request
 
-                data = await resp.json()
-                result = data["items"]
+                if page is None:
+                    raise IncompleteDataError(f"Failed to load page, Endpoint: {self.endpoint}, URL: {url}")
 
-        except Exception as ex:
-            exc_type, exc_obj, tb = sys.exc_info()
-            line_number = tb.tb_lineno
+                page_links = page.get("_links") or {}
+                next_page = page_links.get("next") or {}
+                url = next_page.get("href")
 
-            _LOGGER.error(
-                f"Failed to get data, URL: {url}, Error: {ex}, Line: {line_number}"
-            )
+                page_request = None if url is None else asyncio.ensure_future(self._get_url(url, use_cache))
 
-        return result
+                for item in page.get("items") or []:
+                    yield item
+
+        finally:
+            if page_request is not None and not page_request.done():
+                page_request.cancel()
 
-    async def _get_data(self, params: dict):
+    async def _get_data(self, params: dict, use_cache: bool = False):
         endpoint_data = "/".join(params.values())
 
         url = f"{API_BASE}{self.endpoint}/{endpoint_data}"
 
-        try:
-            async with self._session.request("get", url, headers=self._headers) as resp:
-                resp.raise_for_status()
+        return await self._get_url(url, use_cache)
 
-                return await resp.json()
+    async def _get_url(self, url: str, use_cache: bool = False):
+        try:
+            return await self._request("get", url, use_cache=use_cache)
 
         except Exception as ex:
             exc_type, exc_obj, tb = sys.exc_info()
@@ -75,10 +134,7 @@ class BaseAPI:
         url = f"{API_BASE}{self.endpoint}/{endpoint_data}"
 
         try:
-            async with self._session.request("post", url, headers=self._headers, data=data) as resp:
-                resp.raise_for_status()
-
-                return await resp.json()
+            return await self._request("post", url, data)
 
         except Exception as ex:
             exc_type, exc_obj, tb = sys.exc_info()
@@ -87,3 +143,139 @@ class BaseAPI:
             _LOGGER.error(
                 f"Failed to post data, URL: {url}, Data: {data}, Error: {ex}, Line: {line_number}"
             )
+
+    async def _request(self, method: str, url: str, data: dict | list | None = None, use_cache: bool = False):
+        is_idempotent = method == "get"
+        attempts = self._retry_policy.get("attempts") if is_idempotent else 1
+
+        for attempt in range(attempts):
+            self._circuit_breaker.before_request()
+
+            try:
+                result = await self._send_request(method, url, data, use_cache)
+
+                self._circuit_breaker.record_success()
+
+                return result
+
+            except ClientResponseError as ex:
+                if ex.status < 500:
+                    self._circuit_breaker.record_success()
+
+                    raise
+
+                error = ex
+
+            except (asyncio.TimeoutError, ClientConnectionError, ClientPayloadError) as ex:
+                error = ex
+
+            except Exception:
+                self._circuit_breaker.record_failure()
+
+                raise
+
+            except BaseException:
+                self._circuit_breaker.release_trial()
+
+                raise
+
+            self._circuit_breaker.record_failure()
+
+            if attempt + 1 >= attempts:
+                raise error
+
+            delay = self._get_retry_delay(attempt)
+
+            self._retries += 1
+
+            _LOGGER.warning(
+                f"Request failed, URL: {url}, Error: {error}, "
+                f"Retry in: {delay:.2f}s, Attempt: {attempt + 1}/{attempts}"
+            )
+
+            await asyncio.sleep(delay)
+
+    async def _send_request(
+            self,
+            method: str,
+            url: str,
+            data: dict | list | None = None,
+            use_cache: bool = False
+    ):
+        bucket = self._rate_limiter.get_bucket(self.endpoint)
+
+        headers = self._headers
+        cache_key = f"{self._account_key}:{url}"
+        cached_response = None
+        is_cacheable = use_cache and method == "get" and self._response_cache is not None
+
+        if is_cacheable:
+            cached_response = await self._response_cache.get(cache_key)
+
+            if cached_response is not None:
+                headers = {**self._headers, **self._response_cache.get_validators(cached_response)}
+
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            await bucket.acquire()
+
+            async with self._semaphore:
+                self._requests += 1
+
+                async with self._session.request(method, url, headers=headers, json=data, timeout=self._timeout) as resp:
+                    if resp.status == 304 and cached_response is not None:
+                        self._not_modified += 1
+
+                        return self._response_cache.get_data(cached_response)
+
+                    if resp.status == 304 and attempt < MAX_RATE_LIMIT_RETRIES:
+                        _LOGGER.warning(
+                            f"Not modified without cached response, retrying without validators, URL: {url}"
+                        )
+
+                        headers = self._headers
+
+                        continue
+
+                    if resp.status == 429 and attempt < MAX_RATE_LIMIT_RETRIES:
+                        retry_after = self._rate_limiter.get_retry_after(resp.headers)
+
+                        _LOGGER.warning(
+                            f"Rate limit reached, URL: {url}, Retry after: {retry_after}s, "
+                            f"Attempt: {attempt + 1}/{MAX_RATE_LIMIT_RETRIES}"
+                        )
+
+                        bucket.block(retry_after)
+
+                        continue
+
+                    resp.raise_for_status()
+
+                    result = await resp.json()
+                    response_headers = resp.headers
+
+            if is_cacheable:
+                await self._response_cache.set(cache_key, response_headers, result)
+
+            return result
+
+    def _get_retry_delay(self, attempt: int) -> float:
+        base_delay = self._retry_policy.get("base_delay")
+        max_delay = self._retry_policy.get("max_delay")
+
+        delay = min(max_delay, base_delay * 2 ** attempt)
+
+        return random.uniform(0, delay)
+
+    def get_diagnostic_details(self) -> dict:
+        data = {
+            "requests": self._requests,
+            "retries": self._retries,
+            "not_modified": self._not_modified,
+            "circuit_breaker": self._circuit_breaker.get_diagnostic_details()
+        }
+
+        return data
+
+    @staticmethod
+    def get_account_key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()[:16]
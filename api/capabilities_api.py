@@ -1,19 +1,54 @@
+import asyncio
 import logging
 
 from aiohttp import ClientSession
 
 from api.base_api import BaseAPI
+from helpers.consts import DEFAULT_MAX_CONCURRENCY
 from helpers.enums import Endpoint
+from helpers.rate_limiter import RateLimiter
+from managers.capability_store import CapabilityStore
+from managers.response_cache import ResponseCache
+from models.capability_definition import CapabilityDefinition
 
 _LOGGER = logging.getLogger(__name__)
 
 
 class CapabilitiesAPI(BaseAPI):
-    def __init__(self, token: str, session: ClientSession | None, device_capabilities: dict | None = None):
-        super().__init__(token, session)
+    def __init__(
+            self,
+            token: str,
+            session: ClientSession | None,
+            device_capabilities: dict | None = None,
+            max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+            rate_limiter: RateLimiter | None = None,
+            retry_policy: dict | None = None,
+            circuit_breaker_settings: dict | None = None,
+            response_cache: ResponseCache | None = None,
+            capability_store: CapabilityStore | None = None,
+            request_timeouts: dict[str, dict] | None = None
+    ):
+        super().__init__(
+            token,
+            session,
+            max_concurrency,
+            rate_limiter,
+            retry_policy,
+            circuit_breaker_settings,
+            response_cache,
+            request_timeouts
+        )
 
         self._capabilities: dict | None = None
         self._device_capabilities: dict | None = device_capabilities
+        self._capability_store: CapabilityStore | None = capability_store
+        self._pending_capabilities: dict[tuple[str, str], asyncio.Future] = {}
+        self._pending_load: asyncio.Future | None = None
+        self._pending_store_writes: list[tuple[str, str, dict]] = []
+        self._definitions: dict[str, CapabilityDefinition] = {}
+
+        if device_capabilities is not None:
+            self._update_definitions(device_capabilities)
 
     @property
     def endpoint(self) -> Endpoint | None:
@@ -27,38 +62,117 @@ class CapabilitiesAPI(BaseAPI):
     def device_capabilities(self) -> dict | None:
         return self._device_capabilities
 
+    @property
+    def definitions(self) -> dict[str, CapabilityDefinition]:
+        return self._definitions
+
+    async def load(self):
+        request = self._pending_load
+
+        if request is None:
+            request = asyncio.ensure_future(super().load())
+            request.add_done_callback(self._clear_pending_load)
+
+            self._pending_load = request
+
+        await asyncio.shield(request)
+
+    def _clear_pending_load(self, request: asyncio.Future):
+        if self._pending_load is request:
+            self._pending_load = None
+
     async def _load(self) -> list | dict:
-        capabilities_data = await self._get_metadata()
         capabilities = {
             capability.get("id"): capability
-            for capability in capabilities_data
+            async for capability in self._iterate_metadata(use_cache=True)
         }
 
         self._capabilities = capabilities
 
         return self._capabilities
 
+    def restore(self, device_capabilities: dict[str, dict]):
+        _LOGGER.debug(f"Restoring Device {self.endpoint} data, Capabilities: {len(device_capabilities)}")
+
+        current_device_capabilities = {} if self._device_capabilities is None else self._device_capabilities
+
+        self._device_capabilities = {**current_device_capabilities, **device_capabilities}
+
+        self._update_definitions(device_capabilities)
+
     async def load_details(self, device_capabilities: list[str]):
         _LOGGER.info(f"Importing Device {self.endpoint} data")
 
-        if self._device_capabilities is None:
-            self._device_capabilities = {}
+        current_device_capabilities = {} if self._device_capabilities is None else self._device_capabilities
+
+        missing_capabilities = [
+            capability_id
+            for capability_id in device_capabilities
+            if capability_id not in current_device_capabilities
+        ]
+
+        capabilities_details = await asyncio.gather(*[
+            self._get_capability(self._get_capability_metadata(capability_id))
+            for capability_id in missing_capabilities
+        ])
+
+        loaded_device_capabilities = {} if self._device_capabilities is None else dict(self._device_capabilities)
+        updated_device_capabilities = {}
+
+        for capability_id, device_capability in zip(missing_capabilities, capabilities_details):
+            if device_capability is None:
+                _LOGGER.warning(f"Failed to load capability details, Capability: {capability_id}")
+
+                continue
+
+            if loaded_device_capabilities.get(capability_id) is device_capability:
+                continue
+
+            loaded_device_capabilities[capability_id] = device_capability
+            updated_device_capabilities[capability_id] = device_capability
+
+        self._device_capabilities = loaded_device_capabilities
+
+        self._update_definitions(updated_device_capabilities)
+
+        await self._store_capabilities()
+
+    def _update_definitions(self, device_capabilities: dict[str, dict]):
+        for capability_id, device_capability in device_capabilities.items():
+            self._definitions[capability_id] = CapabilityDefinition.load(device_capability)
+
+    async def _store_capabilities(self):
+        if self._capability_store is None or len(self._pending_store_writes) == 0:
+            return
 
-        for capability_id in device_capabilities:
-            if capability_id not in self._device_capabilities:
-                capability_metadata = self._capabilities.get(capability_id)
+        pending_store_writes = self._pending_store_writes
+        self._pending_store_writes = []
 
-                if capability_metadata is None:
-                    capability_metadata = {
-                        "id": capability_id,
-                        "version": 1
-                    }
+        _LOGGER.debug(f"Storing capabilities, Capabilities: {len(pending_store_writes)}")
 
-                device_capability = await self.get_capability(capability_metadata)
+        loop = asyncio.get_running_loop()
 
-                self._device_capabilities[capability_id] = device_capability
+        await loop.run_in_executor(None, self._capability_store.set_many, pending_store_writes)
+
+    def _get_capability_metadata(self, capability_id: str) -> dict:
+        capability_metadata = self._capabilities.get(capability_id)
+
+        if capability_metadata is None:
+            capability_metadata = {
+                "id": capability_id,
+                "version": 1
+            }
+
+        return capability_metadata
 
     async def get_capability(self, capability_data):
+        capability = await self._get_capability(capability_data)
+
+        await self._store_capabilities()
+
+        return capability
+
+    async def _get_capability(self, capability_data):
         params = ["id", "version"]
 
         params_data = {
@@ -66,8 +180,53 @@ class CapabilitiesAPI(BaseAPI):
             for key in params
         }
 
+        request_key = (params_data["id"], params_data["version"])
+
+        request = self._pending_capabilities.get(request_key)
+
+        if request is None:
+            request = asyncio.ensure_future(self._load_capability(params_data))
+            request.add_done_callback(lambda _: self._pending_capabilities.pop(request_key, None))
+
+            self._pending_capabilities[request_key] = request
+
+        capability = await asyncio.shield(request)
+
+        return capability
+
+    async def _load_capability(self, params_data: dict):
+        capability_id = params_data["id"]
+        version = params_data["version"]
+
+        stored_capability = None
+
+        if self._capability_store is not None:
+            loop = asyncio.get_running_loop()
+
+            stored_capability = await loop.run_in_executor(None, self._capability_store.get, capability_id, version)
+
+            if stored_capability is not None:
+                capability, fetched_at = stored_capability
+
+                if not self._capability_store.is_expired(fetched_at):
+                    return capability
+
         capability = await self._get_data(params_data)
 
+        if capability is None:
+            if stored_capability is not None:
+                _LOGGER.warning(
+                    f"Failed to refresh capability, using stored definition, "
+                    f"Capability: {capability_id}, Version: {version}"
+                )
+
+                capability, _ = stored_capability
+
+            return capability
+
+        if self._capability_store is not None:
+            self._pending_store_writes.append((capability_id, version, capability))
+
         return capability
 
     async def get_capability_presentation(self, capability_data):
@@ -1,20 +1,40 @@
+import asyncio
 import json
 import logging
 
 from aiohttp import ClientSession
 
 from api.base_api import BaseAPI
-from helpers.consts import SUCCESS_UPDATE_STATUS
+from helpers.consts import DEFAULT_MAX_CONCURRENCY, SUCCESS_UPDATE_STATUS
 from helpers.enums import Endpoint
+from helpers.rate_limiter import RateLimiter
 
 _LOGGER = logging.getLogger(__name__)
 
 
 class DevicesAPI(BaseAPI):
-    def __init__(self, token: str, session: ClientSession | None):
-        super().__init__(token, session)
+    def __init__(
+            self,
+            token: str,
+            session: ClientSession | None,
+            max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+            rate_limiter: RateLimiter | None = None,
+            retry_policy: dict | None = None,
+            circuit_breaker_settings: dict | None = None,
+            request_timeouts: dict[str, dict] | None = None
+    ):
+        super().__init__(
+            token,
+            session,
+            max_concurrency,
+            rate_limiter,
+            retry_policy,
+            circuit_breaker_settings,
+            request_timeouts=request_timeouts
+        )
 
         self._devices: list | None = None
+        self._failed_devices: list[str] | None = None
 
     @property
     def endpoint(self) -> Endpoint | None:
@@ -24,18 +44,111 @@ class DevicesAPI(BaseAPI):
     def devices(self) -> list | None:
         return self._devices
 
+    @property
+    def failed_devices(self) -> list[str] | None:
+        return self._failed_devices
+
     async def _load(self) -> list | dict:
-        devices = await self._get_metadata()
+        devices = []
+        status_requests = []
+
+        try:
+            async for device in self._iterate_metadata():
+                devices.append(device)
+                status_requests.append(asyncio.ensure_future(self._get_device_status(device)))
+
+        except BaseException:
+            for status_request in status_requests:
+                status_request.cancel()
+
+            raise
+
+        devices_status = await asyncio.gather(*status_requests)
+
+        loaded_devices = []
+        failed_devices = []
+
+        for device, device_details in zip(devices, devices_status):
+            if device_details is None:
+                device_id = device.get("deviceId")
 
-        for device in devices:
-            device_details = await self._get_device_status(device)
+                _LOGGER.warning(f"Failed to load device status, Device: {device_id}")
+
+                failed_devices.append(device_id)
+
+                continue
 
             device.update(device_details)
 
-        self._devices = devices
+            loaded_devices.append(device)
+
+        self._devices = loaded_devices
+        self._failed_devices = failed_devices
 
         return self._devices
 
+    def restore(self, devices: list[dict]):
+        _LOGGER.debug(f"Restoring {self.endpoint} data, Devices: {len(devices)}")
+
+        self._devices = devices
+        self._failed_devices = []
+
+    async def refresh(self) -> dict[str, dict]:
+        _LOGGER.debug(f"Refreshing {self.endpoint} status")
+
+        devices_status = await asyncio.gather(*[
+            self._get_device_status(device)
+            for device in self._devices
+        ])
+
+        refreshed_devices = {}
+
+        for device, device_details in zip(self._devices, devices_status):
+            device_id = device.get("deviceId")
+
+            if device_details is None:
+                _LOGGER.warning(f"Failed to refresh device status, Device: {device_id}")
+
+                continue
+
+            device.update(device_details)
+
+            refreshed_devices[device_id] = device_details
+
+        return refreshed_devices
+
+    async def load_device(self, device_id: str) -> dict | None:
+        _LOGGER.debug(f"Importing {self.endpoint} data, Device: {device_id}")
+
+        params_data = {
+            "deviceId": device_id
+        }
+
+        device, device_details = await asyncio.gather(
+            self._get_data(params_data),
+            self._get_device_status(params_data)
+        )
+
+        if device is None or device_details is None:
+            _LOGGER.warning(f"Failed to load device, Device: {device_id}")
+
+            return None
+
+        device.update(device_details)
+
+        self.remove_device(device_id)
+
+        self._devices.append(device)
+
+        return device
+
+    def remove_device(self, device_id: str):
+        self._devices = [
+            device
+            for device in self._devices
+            if device.get("deviceId") != device_id
+        ]
+
     async def _get_device_status(self, device_data):
         params = ["deviceId"]
         params_data = {
@@ -48,21 +161,19 @@ class DevicesAPI(BaseAPI):
 
         return device_status
 
-    def get_device_capabilities(self) -> list[str]:
-        device_capabilities: list[str] = []
+    def get_device_capabilities(self, devices: list[dict] | None = None) -> list[str]:
+        device_capabilities: dict[str, None] = {}
 
-        for device in self._devices:
+        for device in self._devices if devices is None else devices:
             components = device.get("components", {})
 
             for component_id in components:
                 component = components.get(component_id)
-                capabilities = list(component.keys())
 
-                for capability_id in capabilities:
-                    if capability_id not in device_capabilities:
-                        device_capabilities.append(capability_id)
+                for capability_id in component:
+                    device_capabilities[capability_id] = None
 
-        return device_capabilities
+        return list(device_capabilities.keys())
 
     async def send_command(self,
                            device_id: str,
@@ -71,47 +182,62 @@ class DevicesAPI(BaseAPI):
                            command: str,
                            args=None) -> bool:
 
-        command_data = {
-            "component": component_id,
-            "capability": capability_id,
-            "command": command,
-        }
+        command_data = self.get_command_data(component_id, capability_id, command, args)
 
-        if args:
-            command_data["args"] = args
+        results = await self.send_commands(device_id, [command_data])
 
+        return results[0]
+
+    async def send_commands(self, device_id: str, commands: list[dict]) -> list[bool]:
         data = {
-            "commands": [command_data]
+            "commands": commands
         }
 
         params = {
-            "deviceId": device_id
+            "deviceId": device_id,
+            "commands": "commands"
         }
 
         response = await self._post_data(params, data)
         if response is None:
-            return False
+            return [False for _ in commands]
 
         results = response.get("results", [])
 
-        if len(results) == 0:
+        if len(results) != len(commands):
             _LOGGER.warning(
-                f"Failed to execute command due to invalid response, "
-                f"Request: {json.dumps(command_data)}, "
+                f"Failed to map command results due to invalid response, "
+                f"Request: {json.dumps(commands)}, "
                 f"Response: {results}"
             )
 
-            return False
+        command_results = []
 
-        result = results[0]
-        result_status = result.get("status")
-        is_success = result_status in SUCCESS_UPDATE_STATUS
+        for i, command_data in enumerate(commands):
+            result = results[i] if i < len(results) else {}
+            result_status = result.get("status")
+            is_success = result_status in SUCCESS_UPDATE_STATUS
 
-        if not is_success:
-            _LOGGER.warning(
-                f"Failed to execute command, "
-                f"Request: {json.dumps(command_data)}, "
-                f"Response: {result}"
-            )
+            if not is_success:
+                _LOGGER.warning(
+                    f"Failed to execute command, "
+                    f"Request: {json.dumps(command_data)}, "
+                    f"Response: {result}"
+                )
+
+            command_results.append(is_success)
+
+        return command_results
+
+    @staticmethod
+    def get_command_data(component_id: str, capability_id: str, command: str, args=None) -> dict:
+        command_data = {
+            "component": component_id,
+            "capability": capability_id,
+            "command": command,
+        }
+
+        if args:
+            command_data["args"] = args
 
-        return is_success
+        return command_data
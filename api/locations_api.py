@@ -1,16 +1,39 @@
+import asyncio
 import logging
 
 from aiohttp import ClientSession
 
 from api.base_api import BaseAPI
+from helpers.consts import DEFAULT_MAX_CONCURRENCY
 from helpers.enums import Endpoint
+from helpers.rate_limiter import RateLimiter
+from managers.response_cache import ResponseCache
 
 _LOGGER = logging.getLogger(__name__)
 
 
 class LocationsAPI(BaseAPI):
-    def __init__(self, token: str, session: ClientSession | None):
-        super().__init__(token, session)
+    def __init__(
+            self,
+            token: str,
+            session: ClientSession | None,
+            max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+            rate_limiter: RateLimiter | None = None,
+            retry_policy: dict | None = None,
+            circuit_breaker_settings: dict | None = None,
+            response_cache: ResponseCache | None = None,
+            request_timeouts: dict[str, dict] | None = None
+    ):
+        super().__init__(
+            token,
+            session,
+            max_concurrency,
+            rate_limiter,
+            retry_policy,
+            circuit_breaker_settings,
+            response_cache,
+            request_timeouts
+        )
 
         self._locations: list | None = None
 
@@ -22,30 +45,59 @@ class LocationsAPI(BaseAPI):
     def endpoint(self) -> Endpoint | None:
         return Endpoint.LOCATIONS
 
+    def restore(self, locations: list[dict]):
+        _LOGGER.debug(f"Restoring {self.endpoint} data, Locations: {len(locations)}")
+
+        self._locations = locations
+
     async def _load(self) -> list | dict:
-        locations = await self._get_metadata()
+        location_requests = []
 
-        for location in locations:
-            location_details = await self._get_location_details(location)
-            location_rooms = await self._get_location_rooms(location)
+        try:
+            async for location in self._iterate_metadata(use_cache=True):
+                location_requests.append(asyncio.ensure_future(self._load_location(location)))
 
-            location_rooms_items = [room for room in location_rooms.get("items")]
+        except BaseException:
+            for location_request in location_requests:
+                location_request.cancel()
 
-            location_details["rooms"] = location_rooms_items
+            raise
 
-            location.update(location_details)
+        locations = await asyncio.gather(*location_requests)
 
-        self._locations = locations
+        self._locations = list(locations)
 
         return self._locations
 
+    async def _load_location(self, location: dict) -> dict:
+        location_details, location_rooms = await asyncio.gather(
+            self._get_location_details(location),
+            self._get_location_rooms(location)
+        )
+
+        if location_details is None:
+            location_details = {}
+
+            _LOGGER.warning(f"Failed to load location details, Location: {location.get('locationId')}")
+
+        location_rooms_items = [] if location_rooms is None else location_rooms.get("items") or []
+
+        # Responses may be served from the response cache, build a new dict instead of updating them
+        loaded_location = {
+            **location,
+            **location_details,
+            "rooms": location_rooms_items
+        }
+
+        return loaded_location
+
     async def _get_location_details(self, location_data):
         params = ["locationId"]
         params_data = {
             key: location_data[key] for key in params
         }
 
-        device_status = await self._get_data(params_data)
+        device_status = await self._get_data(params_data, use_cache=True)
 
         return device_status
 
@@ -57,6 +109,6 @@ class LocationsAPI(BaseAPI):
 
         params_data["rooms"] = "rooms"
 
-        location_rooms = await self._get_data(params_data)
+        location_rooms = await self._get_data(params_data, use_cache=True)
 
         return location_rooms
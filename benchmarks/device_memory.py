@@ -0,0 +1,210 @@
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+CAPABILITIES = {
+    "switch": {
+        "id": "switch",
+        "version": 1,
+        "status": "live",
+        "name": "Switch",
+        "attributes": {
+            "switch": {"schema": {"properties": {"value": {"type": "string", "enum": ["on", "off"]}}}, "setter": "setSwitch"}
+        },
+        "commands": {
+            "on": {"arguments": []},
+            "off": {"arguments": []},
+            "setSwitch": {"arguments": [{"name": "value", "schema": {"type": "string", "enum": ["on", "off"]}}]}
+        }
+    },
+    "switchLevel": {
+        "id": "switchLevel",
+        "version": 1,
+        "status": "live",
+        "name": "Switch Level",
+        "attributes": {
+            "level": {"schema": {"properties": {"value": {"type": "integer", "minimum": 0, "maximum": 100}}}, "setter": "setLevel"}
+        },
+        "commands": {
+            "setLevel": {"arguments": [{"name": "level", "schema": {"type": "integer", "minimum": 0, "maximum": 100}}]}
+        }
+    },
+    "powerConsumptionReport": {
+        "id": "powerConsumptionReport",
+        "version": 1,
+        "status": "live",
+        "name": "Power Consumption Report",
+        "attributes": {
+            "powerConsumption": {"schema": {"properties": {"value": {"type": "object"}}}}
+        },
+        "commands": {}
+    },
+    "temperatureMeasurement": {
+        "id": "temperatureMeasurement",
+        "version": 1,
+        "status": "live",
+        "name": "Temperature Measurement",
+        "attributes": {
+            "temperature": {"schema": {"properties": {"value": {"type": "number"}}}}
+        },
+        "commands": {}
+    },
+    "custom.disabledCapabilities": {
+        "id": "custom.disabledCapabilities",
+        "version": 1,
+        "status": "proposed",
+        "attributes": {
+            "disabledCapabilities": {"schema": {"properties": {"value": {"type": "array"}}}}
+        },
+        "commands": {}
+    },
+    "custom.disabledComponents": {
+        "id": "custom.disabledComponents",
+        "version": 1,
+        "status": "proposed",
+        "attributes": {
+            "disabledComponents": {"schema": {"properties": {"value": {"type": "array"}}}}
+        },
+        "commands": {}
+    }
+}
+
+
+def get_device_data(index: int) -> dict:
+    data = {
+        "deviceId": f"device-{index}",
+        "label": f"Device {index}",
+        "roomId": "room",
+        "components": {
+            "main": {
+                "switch": {"switch": {"value": "on" if index % 2 else "off"}},
+                "switchLevel": {"level": {"value": index % 100}},
+                "powerConsumptionReport": {"powerConsumption": {"value": {"energy": index * 10, "power": index}}},
+                "temperatureMeasurement": {"temperature": {"value": 20}},
+                "custom.disabledCapabilities": {"disabledCapabilities": {"value": []}},
+                "custom.disabledComponents": {"disabledComponents": {"value": []}}
+            },
+            "sub1": {
+                "switch": {"switch": {"value": "off"}},
+                "temperatureMeasurement": {"temperature": {"value": 21}}
+            },
+            "sub2": {
+                "switchLevel": {"level": {"value": 50}},
+                "temperatureMeasurement": {"temperature": {"value": 22}}
+            }
+        }
+    }
+
+    return data
+
+
+def get_definitions() -> dict:
+    try:
+        from models.capability_definition import CapabilityDefinition
+
+    except ImportError:
+        return CAPABILITIES
+
+    if hasattr(CapabilityDefinition, "get"):
+        return CAPABILITIES
+
+    definitions = {
+        capability_id: CapabilityDefinition.load(CAPABILITIES[capability_id])
+        for capability_id in CAPABILITIES
+    }
+
+    return definitions
+
+
+def measure_instances(count: int) -> dict[str, float]:
+    from models.attribute import AttributeEntity
+    from models.capability import CapabilityEntity
+    from models.command import CommandEntity
+    from models.component import ComponentEntity
+    from models.device import DeviceEntity
+    from models.entity import Entity
+
+    results = {}
+
+    for model_class in [AttributeEntity, CommandEntity, CapabilityEntity, ComponentEntity, DeviceEntity, Entity]:
+        gc.collect()
+        tracemalloc.start()
+
+        instances = [model_class() for _ in range(count)]
+
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        results[model_class.__name__] = (current - sys.getsizeof(instances)) / count
+
+        del instances
+
+    return results
+
+
+def measure_devices(count: int) -> dict[str, float]:
+    from managers.entity_manager import EntityManager
+    from models.device import DeviceEntity
+
+    devices_data = [get_device_data(index) for index in range(count)]
+    definitions = get_definitions()
+
+    gc.collect()
+    tracemalloc.start()
+
+    started_at = time.perf_counter()
+
+    devices = [DeviceEntity.load(device_data, definitions) for device_data in devices_data]
+
+    entity_manager = EntityManager()
+    entity_manager.load(devices)
+
+    duration = time.perf_counter() - started_at
+
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    results = {
+        "retained": current,
+        "peak": peak,
+        "per_device": current / count,
+        "entities": len(entity_manager.entities),
+        "duration": duration
+    }
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the memory footprint of loaded devices and entities")
+    parser.add_argument("--devices", type=int, default=2000, help="Number of synthetic devices to load")
+    parser.add_argument("--instances", type=int, default=100000, help="Number of instances per model class")
+    parser.add_argument("--root", default=None, help="Checkout to measure, defaults to this repository")
+
+    args = parser.parse_args()
+
+    root = args.root or os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    sys.path.insert(0, os.path.abspath(root))
+
+    print(f"Root: {os.path.abspath(root)}, Python: {sys.version.split()[0]}")
+
+    for class_name, size in measure_instances(args.instances).items():
+        print(f"{class_name}: {size:.0f} B per instance")
+
+    results = measure_devices(args.devices)
+
+    print(
+        f"Devices: {args.devices}, "
+        f"Entities: {results['entities']}, "
+        f"Retained: {results['retained'] / 1024 / 1024:.2f} MiB, "
+        f"Peak: {results['peak'] / 1024 / 1024:.2f} MiB, "
+        f"Per device: {results['per_device'] / 1024:.2f} KiB, "
+        f"Duration: {results['duration']:.3f}s"
+    )
+
+
+if __name__ == '__main__':
+    main()
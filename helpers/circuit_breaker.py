@@ -0,0 +1,96 @@
+import logging
+import time
+
+from helpers.consts import CIRCUIT_BREAKER_SETTINGS
+from helpers.enums import CircuitState
+from helpers.errors import CircuitOpenError
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    def __init__(self, name: str, settings: dict | None = None):
+        settings = CIRCUIT_BREAKER_SETTINGS if settings is None else settings
+
+        self._name = name
+        self._failure_threshold: int = settings.get("failure_threshold")
+        self._recovery_timeout: float = settings.get("recovery_timeout")
+
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at: float | None = None
+        self._is_trial_running = False
+
+        self._failures = 0
+        self._rejected = 0
+        self._opened = 0
+
+    @property
+    def state(self) -> CircuitState:
+        return self._state
+
+    def before_request(self):
+        if self._state == CircuitState.OPEN:
+            if time.monotonic() - self._opened_at < self._recovery_timeout:
+                self._reject()
+
+            _LOGGER.info(f"Circuit half open, trying a request, Endpoint: {self._name}")
+
+            self._state = CircuitState.HALF_OPEN
+
+        elif self._state == CircuitState.HALF_OPEN and self._is_trial_running:
+            self._reject()
+
+        if self._state == CircuitState.HALF_OPEN:
+            self._is_trial_running = True
+
+    def record_success(self):
+        if self._state != CircuitState.CLOSED:
+            _LOGGER.info(f"Circuit closed, Endpoint: {self._name}")
+
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._is_trial_running = False
+
+    def record_failure(self):
+        self._failures += 1
+        self._consecutive_failures += 1
+
+        is_trial_failed = self._state == CircuitState.HALF_OPEN
+        is_threshold_reached = self._consecutive_failures >= self._failure_threshold
+
+        if self._state != CircuitState.OPEN and (is_trial_failed or is_threshold_reached):
+            _LOGGER.warning(
+                f"Circuit opened, Endpoint: {self._name}, "
+                f"Consecutive failures: {self._consecutive_failures}"
+            )
+
+            self._state = CircuitState.OPEN
+            self._opened_at = time.monotonic()
+            self._opened += 1
+
+        self._is_trial_running = False
+
+    def release_trial(self):
+        if not self._is_trial_running:
+            return
+
+        _LOGGER.debug(f"Circuit trial released without result, Endpoint: {self._name}")
+
+        self._is_trial_running = False
+
+    def _reject(self):
+        self._rejected += 1
+
+        raise CircuitOpenError(f"Circuit is open, Endpoint: {self._name}")
+
+    def get_diagnostic_details(self) -> dict:
+        data = {
+            "state": self._state,
+            "consecutive_failures": self._consecutive_failures,
+            "failures": self._failures,
+            "rejected": self._rejected,
+            "opened": self._opened
+        }
+
+        return data
@@ -1,45 +1,130 @@
+from typing import Any, Callable
+
 from helpers.errors import CommandError
 
+ArgumentValidator = Callable[[Any], None]
+CommandValidator = Callable[[list | None], None]
 
-def _validate_array(name, schema, value):
-    items = schema.get("items")
-    arg_type = items.get("type")
 
-    validate = ARGUMENT_VALIDATORS.get(arg_type)
+def _get_range(schema: dict) -> tuple[float | None, float | None]:
+    arg_min = schema.get("minimum", schema.get("min"))
+    arg_max = schema.get("maximum", schema.get("max"))
 
-    if validate is not None:
-        validate(name, items, value)
+    return arg_min, arg_max
 
 
-def _validate_boolean(name, _schema, value):
-    if not isinstance(value, bool):
-        error_message = (
-            f"Argument {name} [{value}] should be boolean [true, false]"
-        )
+def _compile_range(name: str, schema: dict, value_types: tuple[type, ...], type_name: str) -> ArgumentValidator:
+    arg_min, arg_max = _get_range(schema)
 
-        raise CommandError(error_message)
+    def validate(value):
+        if isinstance(value, bool) or not isinstance(value, value_types):
+            raise CommandError(f"Argument {name} [{value}] should be {type_name}")
 
+        if arg_min is not None and arg_max is not None:
+            if not arg_max >= value >= arg_min:
+                raise CommandError(f"Argument {name} [{value}] should be between {arg_min} and {arg_max}")
+
+        elif arg_min is not None and value < arg_min:
+            raise CommandError(f"Argument {name} [{value}] should be at least {arg_min}")
+
+        elif arg_max is not None and value > arg_max:
+            raise CommandError(f"Argument {name} [{value}] should be up to {arg_max}")
+
+    return validate
 
-def _validate_integer(name, schema, value):
-    arg_min = schema.get("minimum", schema.get("min"))
-    arg_max = schema.get("maximum", schema.get("max"))
 
-    value = int(value)
+def _compile_integer(name: str, schema: dict) -> ArgumentValidator:
+    return _compile_range(name, schema, (int,), "integer")
 
-    if arg_min is not None and arg_max is not None:
-        if not arg_max >= value >= arg_min:
+
+def _compile_number(name: str, schema: dict) -> ArgumentValidator:
+    return _compile_range(name, schema, (int, float), "number")
+
+
+def _compile_boolean(name: str, _schema: dict) -> ArgumentValidator:
+    def validate(value):
+        if not isinstance(value, bool):
             error_message = (
-                f"Argument {name} [{value}] should be between {arg_min} and {arg_max}"
+                f"Argument {name} [{value}] should be boolean [true, false]"
             )
 
             raise CommandError(error_message)
 
+    return validate
 
-def _validate_string(name, schema, value):
-    arg_enum = schema.get("enum")
+
+def _compile_string(name: str, schema: dict) -> ArgumentValidator:
     arg_max_length = schema.get("maxLength")
 
-    if arg_enum:
+    def validate(value):
+        if arg_max_length and len(str(value)) > arg_max_length:
+            error_message = (
+                f"Argument {name} [{value}] should be up to {arg_max_length} characters"
+            )
+
+            raise CommandError(error_message)
+
+    return validate
+
+
+def _compile_array(name: str, schema: dict) -> ArgumentValidator:
+    items = schema.get("items", {})
+    min_items = schema.get("minItems")
+    max_items = schema.get("maxItems")
+
+    validate_item = compile_argument_validator(f"{name}[]", items)
+
+    def validate(value):
+        if not isinstance(value, list):
+            raise CommandError(f"Argument {name} [{value}] should be array")
+
+        if min_items is not None and len(value) < min_items:
+            raise CommandError(f"Argument {name} [{value}] should have at least {min_items} items")
+
+        if max_items is not None and len(value) > max_items:
+            raise CommandError(f"Argument {name} [{value}] should have up to {max_items} items")
+
+        if validate_item is not None:
+            for item in value:
+                validate_item(item)
+
+    return validate
+
+
+def _compile_object(name: str, schema: dict) -> ArgumentValidator:
+    properties = schema.get("properties", {})
+    required = schema.get("required", [])
+
+    property_validators = {
+        property_name: compile_argument_validator(f"{name}.{property_name}", properties[property_name])
+        for property_name in properties
+    }
+
+    property_validators = {
+        property_name: property_validators[property_name]
+        for property_name in property_validators
+        if property_validators[property_name] is not None
+    }
+
+    def validate(value):
+        if not isinstance(value, dict):
+            raise CommandError(f"Argument {name} [{value}] should be object")
+
+        for property_name in required:
+            if property_name not in value:
+                raise CommandError(f"Argument {name} [{value}] is missing {property_name}")
+
+        for property_name in property_validators:
+            if property_name in value:
+                property_validators[property_name](value[property_name])
+
+    return validate
+
+
+def _compile_enum(name: str, schema: dict, validate_type: ArgumentValidator | None) -> ArgumentValidator:
+    arg_enum = schema.get("enum")
+
+    def validate(value):
         if value not in arg_enum:
             error_message = (
                 f"Argument {name} [{value}] should be one of {arg_enum}"
@@ -47,19 +132,67 @@ def _validate_string(name, schema, value):
 
             raise CommandError(error_message)
 
-    if arg_max_length:
-        if len(str) > arg_max_length:
+        if validate_type is not None:
+            validate_type(value)
+
+    return validate
+
+
+def compile_argument_validator(name: str, schema: dict) -> ArgumentValidator | None:
+    arg_type = schema.get("type")
+
+    compile_validator = ARGUMENT_VALIDATORS.get(arg_type)
+
+    validate = None if compile_validator is None else compile_validator(name, schema)
+
+    if schema.get("enum"):
+        validate = _compile_enum(name, schema, validate)
+
+    return validate
+
+
+def compile_command_validator(arguments: list[dict] | None) -> CommandValidator:
+    arguments = [] if arguments is None else arguments
+
+    max_args = len(arguments)
+    min_args = len([
+        argument
+        for argument in arguments
+        if not argument.get("optional", False)
+    ])
+
+    argument_validators = [
+        compile_argument_validator(argument.get("name"), argument.get("schema", {}))
+        for argument in arguments
+    ]
+
+    def validate(args: list | None = None):
+        received_args = 0 if args is None else len(args)
+
+        if not min_args <= received_args <= max_args:
+            expected_args = max_args if min_args == max_args else f"{min_args}-{max_args}"
+
             error_message = (
-                f"Argument {name} [{value}] should be up to {arg_max_length} characters"
+                f"Command was expecting {expected_args} argument, "
+                f"{received_args} were received"
             )
 
             raise CommandError(error_message)
 
+        for i in range(0, received_args):
+            validate_argument = argument_validators[i]
+
+            if validate_argument is not None:
+                validate_argument(args[i])
+
+    return validate
+
 
 ARGUMENT_VALIDATORS = {
-    "integer": _validate_integer,
-    "number": _validate_integer,
-    "string": _validate_string,
-    "boolean": _validate_boolean,
-    "array": _validate_array
+    "integer": _compile_integer,
+    "number": _compile_number,
+    "string": _compile_string,
+    "boolean": _compile_boolean,
+    "array": _compile_array,
+    "object": _compile_object
 }
@@ -1,9 +1,68 @@
+from helpers.enums import Endpoint
+
 API_BASE = "https://api.smartthings.com/v1/"
 
 DIAGNOSTIC_FILE = "diagnostic.json"
 
+CAPABILITY_STORE_FILE = "capabilities.db"
+
+CAPABILITY_STORE_MAX_AGE = 7 * 24 * 60 * 60
+
+RESPONSE_CACHE_FILE = "responses.db"
+
+SNAPSHOT_FILE = "snapshot.json.gz"
+
+SNAPSHOT_VERSION = 1
+
 SUCCESS_UPDATE_STATUS = ["ACCEPTED", "COMPLETED"]
 
+DEFAULT_MAX_CONCURRENCY = 10
+
+RATE_LIMITS = {
+    Endpoint.CAPABILITIES: {"requests": 250, "period": 60, "burst": 25},
+    Endpoint.DEVICES: {"requests": 250, "period": 60, "burst": 25},
+    Endpoint.LOCATIONS: {"requests": 50, "period": 60, "burst": 10},
+}
+
+DEFAULT_RATE_LIMIT = {"requests": 250, "period": 60, "burst": 25}
+
+DEFAULT_RETRY_AFTER = 1
+
+MAX_RATE_LIMIT_RETRIES = 5
+
+EVENT_QUEUE_MAX_SIZE = 1000
+
+EVENT_QUEUE_BATCH_SIZE = 100
+
+JSON_WRITE_BUFFER_SIZE = 64 * 1024
+
+RETRY_POLICY = {
+    "attempts": 4,
+    "base_delay": 0.5,
+    "max_delay": 10
+}
+
+CIRCUIT_BREAKER_SETTINGS = {
+    "failure_threshold": 5,
+    "recovery_timeout": 30
+}
+
+SESSION_SETTINGS = {
+    "limit": 100,
+    "limit_per_host": 20,
+    "keepalive_timeout": 30,
+    "ttl_dns_cache": 300,
+    "timeout": {"total": 60, "sock_connect": 10, "sock_read": 30}
+}
+
+REQUEST_TIMEOUTS = {
+    Endpoint.CAPABILITIES: {"total": 30, "sock_connect": 10, "sock_read": 20},
+    Endpoint.DEVICES: {"total": 20, "sock_connect": 10, "sock_read": 15},
+    Endpoint.LOCATIONS: {"total": 20, "sock_connect": 10, "sock_read": 15},
+}
+
+DEFAULT_REQUEST_TIMEOUT = {"total": 30, "sock_connect": 10, "sock_read": 20}
+
 CAPABILITIES_MAPPING_WITH_DEPENDENCY = {
     "climate": {
         "temperatureMeasurement": [
@@ -10,3 +10,9 @@ class Endpoint(StrEnum):
 class SystemAttribute:
     DISABLED_COMPONENTS = "disabledComponents"
     DISABLED_CAPABILITIES = "disabledCapabilities"
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
@@ -4,3 +4,23 @@ class CommandError(Exception):
                  error_message: str
                  ):
         self.message = error_message
+
+
+class CircuitOpenError(Exception):
+    def __init__(self,
+                 error_message: str
+                 ):
+        self.message = error_message
+
+    def __str__(self):
+        return self.message
+
+
+class IncompleteDataError(Exception):
+    def __init__(self,
+                 error_message: str
+                 ):
+        self.message = error_message
+
+    def __str__(self):
+        return self.message
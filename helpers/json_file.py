@@ -0,0 +1,160 @@
+import asyncio
+import gzip
+import io
+import json
+import logging
+import os
+import secrets
+import stat
+from concurrent.futures import ThreadPoolExecutor
+
+from helpers.consts import JSON_WRITE_BUFFER_SIZE
+
+_LOGGER = logging.getLogger(__name__)
+
+GZIP_MAGIC_NUMBER = b"\x1f\x8b"
+
+
+def _serialize(o):
+    return o.to_dict()
+
+
+def read_json_file(file_path: str) -> dict | list:
+    _LOGGER.debug(f"Reading JSON file, File: {file_path}")
+
+    with open(file_path, "rb") as raw_file:
+        is_compressed = raw_file.read(2) == GZIP_MAGIC_NUMBER
+
+    open_file = gzip.open if is_compressed else open
+
+    with open_file(file_path, "rt", encoding="utf-8") as f:
+        return json.load(f)
+
+
+async def write_json_file(file_path: str, data: dict, compress: bool = False, compact: bool = False):
+    _LOGGER.debug(f"Writing JSON file, File: {file_path}, Compress: {compress}, Compact: {compact}")
+
+    loop = asyncio.get_running_loop()
+
+    encoder = json.JSONEncoder(
+        default=_serialize,
+        sort_keys=True,
+        indent=None if compact else 4,
+        separators=(",", ":") if compact else None
+    )
+
+    indent = "" if compact else "\n    "
+
+    json_file = JsonFile(file_path, compress)
+    executor = ThreadPoolExecutor(max_workers=1)
+
+    try:
+        await loop.run_in_executor(executor, json_file.open)
+
+        buffer = ["{"]
+
+        for index, key in enumerate(sorted(data)):
+            writes = []
+            buffer_size = 0
+
+            buffer.extend([
+                "" if index == 0 else encoder.item_separator,
+                indent,
+                encoder.encode(key),
+                encoder.key_separator
+            ])
+
+            for chunk in encoder.iterencode(data[key]):
+                buffer.append(chunk.replace("\n", indent) if indent else chunk)
+                buffer_size += len(chunk)
+
+                if buffer_size >= JSON_WRITE_BUFFER_SIZE:
+                    writes.append(executor.submit(json_file.write, "".join(buffer)))
+
+                    buffer = []
+                    buffer_size = 0
+
+            writes.append(executor.submit(json_file.write, "".join(buffer)))
+
+            buffer = []
+
+            await asyncio.gather(*[asyncio.wrap_future(write) for write in writes])
+
+        buffer.append("\n}" if indent and len(data) > 0 else "}")
+
+        await asyncio.wrap_future(executor.submit(json_file.write, "".join(buffer)))
+        await asyncio.wrap_future(executor.submit(json_file.commit))
+
+    except BaseException:
+        executor.submit(json_file.abort)
+
+        raise
+
+    finally:
+        executor.shutdown(wait=False)
+
+
+class JsonFile:
+    def __init__(self, file_path: str, compress: bool = False):
+        self._file_path = file_path
+        self._compress = compress
+
+        self._temp_file_path: str | None = None
+        self._raw_file = None
+        self._output_file = None
+        self._text_file: io.TextIOWrapper | None = None
+
+    def open(self):
+        file_descriptor, self._temp_file_path = _create_temp_file(self._file_path)
+
+        self._raw_file = os.fdopen(file_descriptor, "wb")
+        self._output_file = gzip.GzipFile(fileobj=self._raw_file, mode="wb") if self._compress else self._raw_file
+        self._text_file = io.TextIOWrapper(self._output_file, encoding="utf-8")
+
+    def write(self, text: str):
+        self._text_file.write(text)
+
+    def commit(self):
+        self._text_file.flush()
+        self._text_file.detach()
+
+        if self._compress:
+            self._output_file.close()
+
+        self._raw_file.flush()
+        os.fsync(self._raw_file.fileno())
+        self._raw_file.close()
+
+        os.replace(self._temp_file_path, self._file_path)
+
+        self._temp_file_path = None
+
+    def abort(self):
+        if self._raw_file is not None:
+            self._raw_file.close()
+
+        if self._temp_file_path is not None and os.path.exists(self._temp_file_path):
+            os.remove(self._temp_file_path)
+
+
+def _create_temp_file(file_path: str) -> tuple[int, str]:
+    directory = os.path.dirname(file_path) or "."
+    file_name = os.path.basename(file_path)
+
+    while True:
+        temp_file_path = os.path.join(directory, f".{file_name}.{secrets.token_hex(8)}.tmp")
+
+        try:
+            file_descriptor = os.open(temp_file_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+            break
+
+        except FileExistsError:
+            continue
+
+    try:
+        os.chmod(temp_file_path, stat.S_IMODE(os.stat(file_path).st_mode))
+
+    except FileNotFoundError:
+        pass
+
+    return file_descriptor, temp_file_path
@@ -0,0 +1,118 @@
+import asyncio
+import logging
+import time
+from email.utils import parsedate_to_datetime
+
+from helpers.consts import DEFAULT_RATE_LIMIT, DEFAULT_RETRY_AFTER, RATE_LIMITS
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    def __init__(self, requests: int, period: float, burst: int):
+        self._rate = requests / period
+        self._capacity = burst
+        self._tokens: float = burst
+        self._updated_at = time.monotonic()
+        self._blocked_until: float = 0
+        self._lock = asyncio.Lock()
+
+        self._acquired = 0
+        self._throttled = 0
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+
+                    continue
+
+                self._refill(now)
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    self._acquired += 1
+
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+    def block(self, delay: float):
+        self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+        self._tokens = 0
+        self._throttled += 1
+
+    def _refill(self, now: float):
+        elapsed = now - self._updated_at
+
+        self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+        self._updated_at = now
+
+    def get_diagnostic_details(self) -> dict:
+        data = {
+            "rate": self._rate,
+            "capacity": self._capacity,
+            "acquired": self._acquired,
+            "throttled": self._throttled
+        }
+
+        return data
+
+
+class RateLimiter:
+    def __init__(self, rate_limits: dict[str, dict] | None = None):
+        self._rate_limits = RATE_LIMITS if rate_limits is None else rate_limits
+        self._buckets: dict[str, TokenBucket] = {}
+
+    def get_bucket(self, endpoint: str) -> TokenBucket:
+        bucket = self._buckets.get(endpoint)
+
+        if bucket is None:
+            rate_limit = self._rate_limits.get(endpoint, DEFAULT_RATE_LIMIT)
+
+            bucket = TokenBucket(**rate_limit)
+
+            self._buckets[endpoint] = bucket
+
+        return bucket
+
+    def get_diagnostic_details(self) -> dict:
+        data = {
+            str(endpoint): self._buckets[endpoint].get_diagnostic_details()
+            for endpoint in self._buckets
+        }
+
+        return data
+
+    @staticmethod
+    def get_retry_after(headers) -> float:
+        retry_after = headers.get("Retry-After")
+
+        if retry_after is not None:
+            try:
+                return max(0.0, float(retry_after))
+
+            except ValueError:
+                pass
+
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+
+                return max(0.0, retry_at.timestamp() - time.time())
+
+            except (TypeError, ValueError):
+                _LOGGER.debug(f"Invalid Retry-After header, Value: {retry_after}")
+
+        rate_limit_reset = headers.get("X-RateLimit-Reset")
+
+        if rate_limit_reset is not None:
+            try:
+                return max(0.0, float(rate_limit_reset) / 1000)
+
+            except ValueError:
+                _LOGGER.debug(f"Invalid X-RateLimit-Reset header, Value: {rate_limit_reset}")
+
+        return DEFAULT_RETRY_AFTER
@@ -0,0 +1,143 @@
+import logging
+import time
+
+from aiohttp import ClientSession, ClientTimeout, TCPConnector, TraceConfig
+
+from helpers.consts import SESSION_SETTINGS
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SessionStatistics:
+    def __init__(self):
+        self._requests_in_flight = 0
+        self._max_requests_in_flight = 0
+        self._connections_created = 0
+        self._connections_reused = 0
+        self._connect_time = 0.0
+        self._queued = 0
+        self._queue_wait = 0.0
+        self._max_queue_wait = 0.0
+        self._dns_cache_hits = 0
+        self._dns_cache_misses = 0
+        self._connector: TCPConnector | None = None
+
+        self._trace_config = TraceConfig()
+
+        self._trace_config.on_request_start.append(self._on_request_start)
+        self._trace_config.on_request_end.append(self._on_request_end)
+        self._trace_config.on_request_exception.append(self._on_request_end)
+        self._trace_config.on_connection_queued_start.append(self._on_connection_queued_start)
+        self._trace_config.on_connection_queued_end.append(self._on_connection_queued_end)
+        self._trace_config.on_connection_create_start.append(self._on_connection_create_start)
+        self._trace_config.on_connection_create_end.append(self._on_connection_create_end)
+        self._trace_config.on_connection_reuseconn.append(self._on_connection_reuseconn)
+        self._trace_config.on_dns_cache_hit.append(self._on_dns_cache_hit)
+        self._trace_config.on_dns_cache_miss.append(self._on_dns_cache_miss)
+
+    @property
+    def trace_config(self) -> TraceConfig:
+        return self._trace_config
+
+    def bind_connector(self, connector: TCPConnector):
+        self._connector = connector
+
+    async def _on_request_start(self, _session, _context, _params):
+        self._requests_in_flight += 1
+        self._max_requests_in_flight = max(self._max_requests_in_flight, self._requests_in_flight)
+
+    async def _on_request_end(self, _session, _context, _params):
+        self._requests_in_flight -= 1
+
+    async def _on_connection_queued_start(self, _session, context, _params):
+        context.queued_at = time.perf_counter()
+
+        self._queued += 1
+
+    async def _on_connection_queued_end(self, _session, context, _params):
+        queue_wait = time.perf_counter() - context.queued_at
+
+        self._queue_wait += queue_wait
+        self._max_queue_wait = max(self._max_queue_wait, queue_wait)
+
+    async def _on_connection_create_start(self, _session, context, _params):
+        context.connecting_at = time.perf_counter()
+
+    async def _on_connection_create_end(self, _session, context, _params):
+        self._connections_created += 1
+        self._connect_time += time.perf_counter() - context.connecting_at
+
+    async def _on_connection_reuseconn(self, _session, _context, _params):
+        self._connections_reused += 1
+
+    async def _on_dns_cache_hit(self, _session, _context, _params):
+        self._dns_cache_hits += 1
+
+    async def _on_dns_cache_miss(self, _session, _context, _params):
+        self._dns_cache_misses += 1
+
+    def get_diagnostic_details(self) -> dict:
+        connections = self._connections_created + self._connections_reused
+        connector = self._connector
+
+        data = {
+            "requests_in_flight": self._requests_in_flight,
+            "max_requests_in_flight": self._max_requests_in_flight,
+            "connections": {
+                "in_use": None if connector is None else len(connector._acquired),
+                "limit": None if connector is None else connector.limit,
+                "limit_per_host": None if connector is None else connector.limit_per_host,
+                "created": self._connections_created,
+                "reused": self._connections_reused,
+                "reuse_ratio": 0 if connections == 0 else self._connections_reused / connections,
+                "average_connect_time": 0 if self._connections_created == 0 else (
+                    self._connect_time / self._connections_created
+                )
+            },
+            "queue": {
+                "waits": self._queued,
+                "total_wait": self._queue_wait,
+                "max_wait": self._max_queue_wait
+            },
+            "dns_cache": {
+                "hits": self._dns_cache_hits,
+                "misses": self._dns_cache_misses
+            }
+        }
+
+        return data
+
+
+def create_session(settings: dict | None = None, statistics: SessionStatistics | None = None) -> ClientSession:
+    session_settings = SESSION_SETTINGS if settings is None else {**SESSION_SETTINGS, **settings}
+
+    _LOGGER.info(
+        f"Creating session, "
+        f"Limit: {session_settings['limit']}, "
+        f"Limit per host: {session_settings['limit_per_host']}, "
+        f"Keep-alive: {session_settings['keepalive_timeout']}s, "
+        f"DNS cache TTL: {session_settings['ttl_dns_cache']}s"
+    )
+
+    connector = TCPConnector(
+        limit=session_settings["limit"],
+        limit_per_host=session_settings["limit_per_host"],
+        keepalive_timeout=session_settings["keepalive_timeout"],
+        ttl_dns_cache=session_settings["ttl_dns_cache"],
+        use_dns_cache=True
+    )
+
+    trace_configs = []
+
+    if statistics is not None:
+        statistics.bind_connector(connector)
+
+        trace_configs.append(statistics.trace_config)
+
+    session = ClientSession(
+        connector=connector,
+        timeout=ClientTimeout(**session_settings["timeout"]),
+        trace_configs=trace_configs
+    )
+
+    return session
@@ -1,12 +1,14 @@
 import asyncio
-import json
 import logging
 import os
 import sys
 
 from aiohttp import ClientSession
 
-from helpers.consts import DIAGNOSTIC_FILE
+from helpers.consts import CAPABILITY_STORE_FILE, RESPONSE_CACHE_FILE, SNAPSHOT_FILE
+from helpers.session_factory import SessionStatistics, create_session
+from managers.capability_store import CapabilityStore
+from managers.response_cache import ResponseCache
 from managers.smart_things_broker import SmartThingsBroker
 
 DEBUG = str(os.environ.get("DEBUG", False)).lower() == str(True).lower()
@@ -30,31 +32,51 @@ class MainApp:
         self._token = os.environ.get("TOKEN")
 
         self._session: ClientSession | None = None
+        self._session_statistics: SessionStatistics | None = None
         self._broker: SmartThingsBroker | None = None
+        self._capability_store: CapabilityStore | None = None
+        self._response_cache: ResponseCache | None = None
 
-        self._file_path = os.path.join(sys.path[1], "data", DIAGNOSTIC_FILE)
+        self._capability_store_path = os.path.join(sys.path[1], "data", CAPABILITY_STORE_FILE)
+        self._response_cache_path = os.path.join(sys.path[1], "data", RESPONSE_CACHE_FILE)
+        self._snapshot_path = os.path.join(sys.path[1], "data", SNAPSHOT_FILE)
 
     async def initialize(self):
-        self._session = ClientSession()
+        self._session_statistics = SessionStatistics()
+        self._session = create_session(statistics=self._session_statistics)
+        self._capability_store = CapabilityStore(self._capability_store_path)
+        self._response_cache = ResponseCache(self._response_cache_path)
 
-        device_capabilities: dict | None = None
+        self._broker = SmartThingsBroker(
+            self._token,
+            self._session,
+            capability_store=self._capability_store,
+            response_cache=self._response_cache,
+            session_statistics=self._session_statistics
+        )
 
-        if os.path.exists(self._file_path):
-            with open(self._file_path, "r") as f:
-                diagnostic_data = json.load(f)
+        is_restored = await self._broker.warm_start(self._snapshot_path)
 
-                device_capabilities = diagnostic_data.get("api", {}).get("device_capabilities")
+        if is_restored:
+            await self._broker.reconcile_task
 
-        self._broker = SmartThingsBroker(self._token, self._session, device_capabilities)
+        await self._broker.save_snapshot(self._snapshot_path)
 
-        await self._broker.initialize()
-
-        self._broker.save_diagnostic_details()
+        await self._broker.save_diagnostic_details()
 
     async def terminate(self):
+        if self._broker is not None:
+            await self._broker.terminate()
+
         if self._session is not None:
             await self._session.close()
 
+        if self._capability_store is not None:
+            self._capability_store.close()
+
+        if self._response_cache is not None:
+            self._response_cache.close()
+
 
 if __name__ == '__main__':
     loop = asyncio.new_event_loop()
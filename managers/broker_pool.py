@@ -0,0 +1,231 @@
+import asyncio
+import logging
+
+from aiohttp import ClientSession
+
+from api.base_api import BaseAPI
+from api.capabilities_api import CapabilitiesAPI
+from helpers.consts import DEFAULT_MAX_CONCURRENCY
+from helpers.enums import Endpoint
+from helpers.rate_limiter import RateLimiter
+from helpers.session_factory import SessionStatistics
+from managers.capability_store import CapabilityStore
+from managers.response_cache import ResponseCache
+from managers.smart_things_broker import SmartThingsBroker
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class BrokerPool:
+    def __init__(
+            self,
+            session: ClientSession,
+            max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+            rate_limits: dict[str, dict] | None = None,
+            retry_policy: dict | None = None,
+            circuit_breaker_settings: dict | None = None,
+            capability_store: CapabilityStore | None = None,
+            response_cache: ResponseCache | None = None,
+            debounce_window: float | None = None,
+            lazy: bool = False,
+            request_timeouts: dict[str, dict] | None = None,
+            session_statistics: SessionStatistics | None = None
+    ):
+        _LOGGER.info("Initializing manager")
+
+        self._session: ClientSession = session
+        self._max_concurrency = max_concurrency
+        self._rate_limits = rate_limits
+        self._retry_policy = retry_policy
+        self._circuit_breaker_settings = circuit_breaker_settings
+        self._capability_store = capability_store
+        self._response_cache = response_cache
+        self._debounce_window = debounce_window
+        self._lazy = lazy
+        self._request_timeouts = request_timeouts
+        self._session_statistics: SessionStatistics | None = session_statistics
+
+        self._brokers: dict[str, SmartThingsBroker] = {}
+        self._tokens: dict[str, str] = {}
+
+        self._capabilities_api: CapabilitiesAPI | None = None
+
+    @property
+    def brokers(self) -> list[SmartThingsBroker]:
+        return list(self._brokers.values())
+
+    def get_broker(self, token: str) -> SmartThingsBroker | None:
+        return self._brokers.get(BaseAPI.get_account_key(token))
+
+    def add_account(self, token: str) -> SmartThingsBroker:
+        account_key = BaseAPI.get_account_key(token)
+
+        broker = self._brokers.get(account_key)
+
+        if broker is not None:
+            return broker
+
+        _LOGGER.info(f"Adding account, Account: {account_key}")
+
+        if self._capabilities_api is None:
+            self._capabilities_api = CapabilitiesAPI(
+                token,
+                self._session,
+                None,
+                self._max_concurrency,
+                RateLimiter(self._rate_limits),
+                self._retry_policy,
+                self._circuit_breaker_settings,
+                self._response_cache,
+                self._capability_store,
+                self._request_timeouts
+            )
+
+        broker = SmartThingsBroker(
+            token,
+            self._session,
+            None,
+            self._max_concurrency,
+            self._rate_limits,
+            self._retry_policy,
+            self._circuit_breaker_settings,
+            self._capability_store,
+            self._response_cache,
+            self._debounce_window,
+            self._lazy,
+            self._capabilities_api,
+            self._request_timeouts,
+            self._session_statistics
+        )
+
+        self._brokers[account_key] = broker
+        self._tokens[account_key] = token
+
+        self._bind_capabilities_api()
+
+        return broker
+
+    async def remove_account(self, token: str):
+        account_key = BaseAPI.get_account_key(token)
+
+        broker = self._brokers.pop(account_key, None)
+
+        if broker is None:
+            return
+
+        _LOGGER.info(f"Removing account, Account: {account_key}")
+
+        self._tokens.pop(account_key, None)
+
+        self._bind_capabilities_api()
+
+        await broker.terminate()
+
+    async def initialize(self):
+        _LOGGER.info(f"Initializing accounts, Accounts: {len(self._brokers)}")
+
+        await self._load_capabilities()
+
+        account_keys = list(self._brokers.keys())
+
+        results = await asyncio.gather(
+            *[self._brokers[account_key].initialize() for account_key in account_keys],
+            return_exceptions=True
+        )
+
+        for account_key, result in zip(account_keys, results):
+            if isinstance(result, Exception):
+                _LOGGER.error(f"Failed to initialize account, Account: {account_key}, Error: {result}")
+
+    async def initialize_account(self, token: str) -> SmartThingsBroker:
+        broker = self.add_account(token)
+
+        await self._load_capabilities()
+
+        await broker.initialize()
+
+        return broker
+
+    async def terminate(self):
+        _LOGGER.info("Terminating manager")
+
+        await asyncio.gather(*[broker.terminate() for broker in self._brokers.values()])
+
+    def _bind_capabilities_api(self):
+        capabilities_api = self._capabilities_api
+
+        if capabilities_api is None or capabilities_api.account_key in self._tokens or len(self._tokens) == 0:
+            return
+
+        account_key = next(iter(self._tokens))
+
+        _LOGGER.info(f"Switching shared capabilities account, Account: {account_key}")
+
+        capabilities_api.set_token(self._tokens[account_key])
+
+    async def _load_capabilities(self):
+        if self._capabilities_api is None or self._capabilities_api.capabilities is not None:
+            return
+
+        try:
+            await self._capabilities_api.load()
+
+        except Exception as ex:
+            _LOGGER.error(f"Failed to load shared capabilities catalog, will retry on next load, Error: {ex}")
+
+            raise
+
+    def get_diagnostic_details(self) -> dict:
+        _LOGGER.info("Retrieving diagnostic details")
+
+        capabilities_endpoint = str(Endpoint.CAPABILITIES)
+
+        accounts = {}
+        requests_details = []
+
+        for account_key, broker in self._brokers.items():
+            account_requests = {
+                endpoint: endpoint_details
+                for endpoint, endpoint_details in broker.get_requests_details().items()
+                if endpoint != capabilities_endpoint
+            }
+
+            accounts[account_key] = {
+                "devices": 0 if broker.devices is None else len(broker.devices),
+                "requests": account_requests
+            }
+
+            requests_details.extend(account_requests.values())
+
+        capabilities_api = self._capabilities_api
+        capabilities = None
+
+        if capabilities_api is not None:
+            capabilities_requests = capabilities_api.get_diagnostic_details()
+
+            capabilities = {
+                "catalog": 0 if capabilities_api.capabilities is None else len(capabilities_api.capabilities),
+                "definitions": 0 if capabilities_api.device_capabilities is None else len(
+                    capabilities_api.device_capabilities
+                ),
+                "requests": capabilities_requests
+            }
+
+            requests_details.append(capabilities_requests)
+
+        session_statistics = self._session_statistics
+
+        data = {
+            "accounts": accounts,
+            "capabilities": capabilities,
+            "session": None if session_statistics is None else session_statistics.get_diagnostic_details(),
+            "totals": {
+                "accounts": len(accounts),
+                "devices": sum(account["devices"] for account in accounts.values()),
+                "requests": sum(details["requests"] for details in requests_details),
+                "retries": sum(details["retries"] for details in requests_details),
+                "not_modified": sum(details["not_modified"] for details in requests_details)
+            }
+        }
+
+        return data
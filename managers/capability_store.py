@@ -0,0 +1,85 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+
+from helpers.consts import CAPABILITY_STORE_MAX_AGE
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CapabilityStore:
+    def __init__(self, file_path: str, max_age: float = CAPABILITY_STORE_MAX_AGE):
+        _LOGGER.info(f"Initializing capability store, File: {file_path}")
+
+        self._file_path = file_path
+        self._max_age = max_age
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def max_age(self) -> float:
+        return self._max_age
+
+    def get(self, capability_id: str, version: str) -> tuple[dict, float] | None:
+        with self._lock:
+            connection = self._get_connection()
+
+            row = connection.execute(
+                "SELECT data, fetched_at FROM capabilities WHERE id = ? AND version = ?",
+                (capability_id, str(version))
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        data, fetched_at = row
+
+        return json.loads(data), fetched_at
+
+    def set(self, capability_id: str, version: str, data: dict):
+        self.set_many([(capability_id, version, data)])
+
+    def set_many(self, capabilities: list[tuple[str, str, dict]]):
+        fetched_at = time.time()
+
+        rows = [
+            (capability_id, str(version), json.dumps(data), fetched_at)
+            for capability_id, version, data in capabilities
+        ]
+
+        with self._lock:
+            connection = self._get_connection()
+
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO capabilities (id, version, data, fetched_at) VALUES (?, ?, ?, ?)",
+                    rows
+                )
+
+    def is_expired(self, fetched_at: float) -> bool:
+        return time.time() - fetched_at > self._max_age
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+
+                self._connection = None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = sqlite3.connect(self._file_path, check_same_thread=False)
+
+            with self._connection:
+                self._connection.execute(
+                    "CREATE TABLE IF NOT EXISTS capabilities ("
+                    "id TEXT NOT NULL, "
+                    "version TEXT NOT NULL, "
+                    "data TEXT NOT NULL, "
+                    "fetched_at REAL NOT NULL, "
+                    "PRIMARY KEY (id, version))"
+                )
+
+        return self._connection
@@ -0,0 +1,90 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CommandDebouncer:
+    def __init__(self, window: float):
+        self._window = window
+        self._pending: dict[tuple, dict] = {}
+        self._sending: set[asyncio.Task] = set()
+
+        self._received = 0
+        self._sent = 0
+
+    async def debounce(self, key: tuple, args: list | None, send: Callable[[list | None], Awaitable[bool]]) -> bool:
+        self._received += 1
+
+        pending = self._pending.get(key)
+
+        if pending is None:
+            loop = asyncio.get_running_loop()
+
+            pending = {
+                "future": loop.create_future(),
+                "handle": loop.call_later(self._window, self._flush, key)
+            }
+
+            self._pending[key] = pending
+
+        else:
+            _LOGGER.debug(f"Collapsing command, Key: {key}, Args: {args}")
+
+        pending["args"] = args
+        pending["send"] = send
+
+        return await asyncio.shield(pending["future"])
+
+    async def cancel(self):
+        for key in self._pending:
+            pending = self._pending[key]
+
+            pending["handle"].cancel()
+
+            if not pending["future"].done():
+                pending["future"].set_result(False)
+
+        self._pending = {}
+
+        if len(self._sending) > 0:
+            _LOGGER.debug(f"Waiting for commands in flight, Commands: {len(self._sending)}")
+
+            await asyncio.gather(*self._sending, return_exceptions=True)
+
+    def _flush(self, key: tuple):
+        pending = self._pending.pop(key)
+        future = pending["future"]
+
+        self._sent += 1
+
+        def _on_sent(task: asyncio.Task):
+            if future.done():
+                return
+
+            if task.cancelled():
+                future.set_result(False)
+
+            elif task.exception() is not None:
+                future.set_exception(task.exception())
+
+            else:
+                future.set_result(task.result())
+
+        task = asyncio.ensure_future(pending["send"](pending["args"]))
+        task.add_done_callback(_on_sent)
+        task.add_done_callback(self._sending.discard)
+
+        self._sending.add(task)
+
+    def get_diagnostic_details(self) -> dict:
+        data = {
+            "window": self._window,
+            "pending": len(self._pending),
+            "sending": len(self._sending),
+            "received": self._received,
+            "sent": self._sent
+        }
+
+        return data
@@ -0,0 +1,155 @@
+import logging
+
+from helpers.errors import CommandError
+from models.attribute import AttributeEntity
+from models.capability import CapabilityEntity
+from models.command import CommandEntity
+from models.device import DeviceEntity
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class DeviceRegistry:
+    def __init__(self, lazy: bool = False):
+        self._lazy = lazy
+        self._devices: dict[str, DeviceEntity] = {}
+        self._attributes: dict[tuple[str, str, str, str], AttributeEntity] = {}
+        self._commands: dict[tuple[str, str, str, str], CommandEntity] = {}
+        self._device_keys: dict[str, set[tuple[str, str, str, str]]] = {}
+
+    @property
+    def devices(self) -> list[DeviceEntity]:
+        return list(self._devices.values())
+
+    def load(self, devices: list[DeviceEntity]):
+        _LOGGER.info("Loading device registry")
+
+        self._devices = {}
+        self._attributes = {}
+        self._commands = {}
+        self._device_keys = {}
+
+        for device in devices:
+            self.add_device(device)
+
+    def add_device(self, device: DeviceEntity):
+        self.remove_device(device.device_id)
+
+        self._devices[device.device_id] = device
+        self._device_keys[device.device_id] = set()
+
+        if self._lazy:
+            return
+
+        for component_id in device.components:
+            component = device.components.get(component_id)
+
+            for capability_id in component.capabilities:
+                capability = component.capabilities.get(capability_id)
+
+                for attribute_key in capability.attributes:
+                    key = (device.device_id, component_id, capability_id, attribute_key)
+
+                    self._add_key(self._attributes, key, capability.attributes.get(attribute_key))
+
+                for command in capability.commands:
+                    key = (device.device_id, component_id, capability_id, command)
+
+                    self._add_key(self._commands, key, capability.commands.get(command))
+
+    def remove_device(self, device_id: str):
+        device = self._devices.pop(device_id, None)
+
+        if device is None:
+            return
+
+        for key in self._device_keys.pop(device_id, set()):
+            self._attributes.pop(key, None)
+            self._commands.pop(key, None)
+
+    def get_device(self, device_id: str) -> DeviceEntity | None:
+        return self._devices.get(device_id)
+
+    def get_attribute(
+            self,
+            device_id: str,
+            component_id: str,
+            capability_id: str,
+            attribute_key: str
+    ) -> AttributeEntity | None:
+        key = (device_id, component_id, capability_id, attribute_key)
+
+        attribute = self._attributes.get(key)
+
+        if attribute is None and self._lazy:
+            capability = self._get_capability(device_id, component_id, capability_id)
+
+            if capability is not None:
+                attribute = capability.attributes.get(attribute_key)
+
+                if attribute is not None:
+                    self._add_key(self._attributes, key, attribute)
+
+        return attribute
+
+    def get_command(
+            self,
+            device_id: str,
+            component_id: str,
+            capability_id: str,
+            command: str
+    ) -> CommandEntity | None:
+        key = (device_id, component_id, capability_id, command)
+
+        command_item = self._commands.get(key)
+
+        if command_item is None and self._lazy:
+            capability = self._get_capability(device_id, component_id, capability_id)
+
+            if capability is not None:
+                command_item = capability.commands.get(command)
+
+                if command_item is not None:
+                    self._add_key(self._commands, key, command_item)
+
+        return command_item
+
+    def validate_command(
+            self,
+            device_id: str,
+            component_id: str,
+            capability_id: str,
+            command: str,
+            args: list | None = None
+    ):
+        command_item = self.get_command(device_id, component_id, capability_id, command)
+
+        if command_item is None:
+            device = self.get_device(device_id)
+
+            if device is None:
+                raise CommandError(f"Device is not available")
+
+            device.validate_command(component_id, capability_id, command, args)
+
+            return
+
+        command_item.validate_command(args)
+
+    def _get_capability(self, device_id: str, component_id: str, capability_id: str) -> CapabilityEntity | None:
+        device = self._devices.get(device_id)
+
+        if device is None:
+            return None
+
+        component = device.components.get(component_id)
+
+        if component is None:
+            return None
+
+        return component.capabilities.get(capability_id)
+
+    def _add_key(self, index: dict, key: tuple[str, str, str, str], item: AttributeEntity | CommandEntity):
+        index[key] = item
+
+        self._device_keys[key[0]].add(key)
@@ -1,6 +1,7 @@
 import logging
 
-from helpers.consts import CAPABILITIES_MAPPING_WITH_DEPENDENCY, CAPABILITIES_MAPPING
+from managers.entity_mapper import EntityMapper
+from models.attribute import AttributeEntity
 from models.capability import CapabilityEntity
 from models.device import DeviceEntity
 from models.entity import Entity
@@ -9,265 +10,179 @@ _LOGGER = logging.getLogger(__name__)
 
 
 class EntityManager:
-    def __init__(self):
+    def __init__(self, lazy: bool = False):
         _LOGGER.info("Initializing manager")
 
-        self._entities: list[Entity] | None = None
-
-        self._handlers = [
-            self._default_handler,
-            self._mapping_with_dependency_handler,
-            self._mapping_handler,
-            self._power_consumption_report_handler
-        ]
-
-        self._entity_checks = {
-            "binary_sensor": self._is_binary_sensor,
-            "sensor": self._is_sensor,
-            "number": self._is_number,
-            "select": self._is_select,
-            "switch": self._is_switch,
-            "ignored": self._is_ignored,
-        }
+        self._lazy = lazy
+        self._pending_devices: list[DeviceEntity] | None = None
+
+        self._entities: dict[str, Entity] = {}
+        self._entities_by_type: dict[str, dict[str, Entity]] = {}
+        self._entities_by_device: dict[str, dict[str, Entity]] = {}
+        self._entities_by_capability: dict[str, dict[str, Entity]] = {}
+
+        self._entity_mapper = EntityMapper()
 
     @property
-    def entities(self):
-        return self._entities
+    def entities(self) -> list[Entity]:
+        self._load_pending_devices()
 
-    def get_entities(self, entity_type: str):
+        return list(self._entities.values())
+
+    def get_entities(self, entity_type: str) -> list[Entity]:
         _LOGGER.info(f"Get entities for type: {entity_type}")
 
-        entities = [
-            entity
-            for entity in self._entities
-            if entity.type == entity_type
-        ]
+        self._load_pending_devices()
+
+        return self._get_indexed_entities(self._entities_by_type, entity_type)
+
+    def get_device_entities(self, device_id: str) -> list[Entity]:
+        self._load_pending_devices()
 
-        return entities
+        return self._get_indexed_entities(self._entities_by_device, device_id)
+
+    def get_capability_entities(self, capability_id: str) -> list[Entity]:
+        self._load_pending_devices()
+
+        return self._get_indexed_entities(self._entities_by_capability, capability_id)
+
+    def get_entity(self, unique_id: str) -> Entity | None:
+        self._load_pending_devices()
+
+        return self._entities.get(unique_id)
 
     def load(self, devices: list[DeviceEntity]):
         _LOGGER.info("Loading Entity recommendation")
 
-        self._entities = []
+        self._pending_devices = devices
 
-        for handler in self._handlers:
-            for device in devices:
-                for component_id in device.components:
-                    component = device.components.get(component_id)
+        if not self._lazy:
+            self._load_pending_devices()
 
-                    handler(device, component_id, component.capabilities)
+    def upsert_device(self, device: DeviceEntity) -> dict[str, list[Entity]]:
+        _LOGGER.debug(f"Updating entities of {device.label}")
 
-    def _power_consumption_report_handler(
-            self,
-            device: DeviceEntity,
-            component_id: str,
-            component_capabilities: dict[str, CapabilityEntity]
-    ):
-        _LOGGER.debug(
-            f"Creating power consumption report entities of {device.label}, "
-            f"Component: {component_id}"
-        )
+        self._load_pending_devices()
 
-        capability_id = "powerConsumptionReport"
-        attribute_key = "powerConsumption"
+        current_entities = dict(self._entities_by_device.get(device.device_id, {}))
 
-        capability = component_capabilities.get(capability_id)
+        entities_diff = {
+            "added": [],
+            "removed": [],
+            "changed": []
+        }
 
-        if capability is None:
-            return
+        for entity in self._entity_mapper.map_device(device):
+            current_entity = current_entities.pop(entity.unique_id, None)
 
-        component_attributes = capability.attributes
-        power_consumption_attribute = component_attributes.get(attribute_key)
+            if current_entity is None:
+                entities_diff["added"].append(entity)
 
-        if power_consumption_attribute is not None:
-            attribute_value = power_consumption_attribute.value
-            if attribute_value is None:
-                return
+            elif self._is_entity_changed(current_entity, entity):
+                entities_diff["changed"].append(entity)
 
-            props = power_consumption_attribute.properties.get("properties", {})
+            self._add_entity(entity)
 
-            params = [
-                device.device_id,
-                component_id,
-                capability_id,
-                attribute_key
-            ]
+        for unique_id in current_entities:
+            self._remove_entity(unique_id)
 
-            unique_id = ".".join(params)
+            entities_diff["removed"].append(current_entities[unique_id])
 
-            power_consumption_report_entities = [
-                Entity.load(
-                    device.label,
-                    device.device_id,
-                    component_id,
-                    capability_id,
-                    attribute_key,
-                    "sensor",
-                    props.get(attribute_sub_key),
+        return entities_diff
 
-                )
-                for attribute_sub_key in attribute_value
-            ]
-
-            self._entities = [
-                entity
-                for entity in self._entities
-                if entity.unique_id != unique_id
-            ]
-
-            self._entities.extend(power_consumption_report_entities)
-
-    def _mapping_with_dependency_handler(
-            self,
-            device: DeviceEntity,
-            component_id: str,
-            component_capabilities: dict[str, CapabilityEntity]
-    ):
-        _LOGGER.debug(
-            f"Creating mapped entities (with dependency) of {device.label}, "
-            f"Component: {component_id}"
-        )
-
-        for entity_type in CAPABILITIES_MAPPING_WITH_DEPENDENCY:
-            mappings = CAPABILITIES_MAPPING_WITH_DEPENDENCY[entity_type]
-
-            for main_capability_id in mappings:
-                if main_capability_id in component_capabilities:
-                    mapped_capabilities = mappings[main_capability_id]
-
-                    relevant_capabilities = {
-                        capability_id: component_capabilities[capability_id]
-                        for capability_id in component_capabilities
-                        if capability_id in mapped_capabilities or capability_id == main_capability_id
-                    }
-
-                    if len(relevant_capabilities.keys()) == 1:
-                        continue
-
-                    entity = Entity.load(
-                        device.label,
-                        device.device_id,
-                        component_id,
-                        main_capability_id,
-                        main_capability_id,
-                        entity_type,
-                        relevant_capabilities,
-                    )
-
-                    self._entities.append(entity)
-
-    def _mapping_handler(
-            self,
-            device: DeviceEntity,
-            component_id: str,
-            component_capabilities: dict[str, CapabilityEntity]
-    ):
-        _LOGGER.debug(
-            f"Creating mapped entities (without dependency) of {device.label}, "
-            f"Component: {component_id}"
-        )
-
-        for entity_type in CAPABILITIES_MAPPING:
-            mappings = CAPABILITIES_MAPPING[entity_type]
-
-            relevant_capabilities = {
-                capability_id: component_capabilities[capability_id]
-                for capability_id in component_capabilities
-                if capability_id in mappings
-            }
-
-            if len(relevant_capabilities.keys()) == 0:
-                continue
-
-            entity = Entity.load(
-                device.label,
-                device.device_id,
-                component_id,
-                list(relevant_capabilities.keys())[0],
-                list(relevant_capabilities.keys())[0],
-                entity_type,
-                relevant_capabilities,
-            )
-
-            self._entities.append(entity)
-
-    def _default_handler(
-            self,
-            device: DeviceEntity,
-            component_id: str,
-            component_capabilities: dict[str, CapabilityEntity]
-    ):
-        _LOGGER.debug(
-            f"Creating default entities of {device.label}, "
-            f"Component: {component_id}"
-        )
-
-        for capability_id in component_capabilities:
-            capability = component_capabilities.get(capability_id)
-
-            for attribute_key in capability.attributes:
-                attribute = capability.attributes.get(attribute_key)
-
-                options_number = 0
-                has_min_max = False
-
-                has_setter = attribute.default_command is not None
-                property_type = None
-
-                if attribute.properties:
-                    property_type = attribute.properties.get("type")
-                    options_number = len(attribute.properties.get("enum", []))
-                    has_min_max = (
-                        ("min" in attribute.properties or "minimum" in attribute.properties)
-                        and
-                        ("max" in attribute.properties or "maximum" in attribute.properties)
-                    )
-
-                entity_type = self.get_entity_type(property_type, has_setter, has_min_max, options_number)
-
-                if entity_type is not None:
-                    entity = Entity.load(
-                        device.label,
-                        device.device_id,
-                        component_id,
-                        capability_id,
-                        attribute_key,
-                        entity_type,
-                        attribute.__dict__,
-                    )
-
-                    self._entities.append(entity)
+    def remove_device(self, device_id: str) -> dict[str, list[Entity]]:
+        _LOGGER.debug(f"Removing entities of device {device_id}")
+
+        self._load_pending_devices()
+
+        current_entities = self._entities_by_device.pop(device_id, {})
+
+        for unique_id in current_entities:
+            self._remove_entity(unique_id)
+
+        entities_diff = {
+            "added": [],
+            "removed": list(current_entities.values()),
+            "changed": []
+        }
+
+        return entities_diff
 
     def get_entity_type(self, has_properties, has_setter, has_min_max, options_number):
-        for entity_type in self._entity_checks:
-            check = self._entity_checks.get(entity_type)
-            is_match = check(has_properties, has_setter, has_min_max, options_number)
+        return self._entity_mapper.get_entity_type(has_properties, has_setter, has_min_max, options_number)
 
-            if is_match:
-                return entity_type
+    def _load_pending_devices(self):
+        if self._pending_devices is None:
+            return
 
-        return None
+        devices = self._pending_devices
 
-    @staticmethod
-    def _is_ignored(property_type, _has_setter, _has_min_max, _options_number) -> bool:
-        return property_type is not None
+        self._pending_devices = None
+        self._entities = {}
+        self._entities_by_type = {}
+        self._entities_by_device = {}
+        self._entities_by_capability = {}
 
-    @staticmethod
-    def _is_number(property_type, has_setter, has_min_max, _options_number) -> bool:
-        return (has_setter and has_min_max) or property_type in ["number", "integer"]
+        for device in devices:
+            for entity in self._entity_mapper.map_device(device):
+                self._add_entity(entity)
 
-    @staticmethod
-    def _is_switch(_property_type, has_setter, _has_min_max, options_number) -> bool:
-        return has_setter and options_number == 2
+    def _add_entity(self, entity: Entity):
+        self._remove_entity(entity.unique_id)
 
-    @staticmethod
-    def _is_select(_property_type, has_setter, _has_min_max, options_number) -> bool:
-        return has_setter and options_number > 2
+        self._entities[entity.unique_id] = entity
+
+        self._entities_by_type.setdefault(entity.type, {})[entity.unique_id] = entity
+        self._entities_by_device.setdefault(entity.device_id, {})[entity.unique_id] = entity
+        self._entities_by_capability.setdefault(entity.capability_id, {})[entity.unique_id] = entity
+
+    def _remove_entity(self, unique_id: str):
+        entity = self._entities.pop(unique_id, None)
+
+        if entity is None:
+            return
+
+        self._entities_by_type[entity.type].pop(unique_id)
+        self._entities_by_device.get(entity.device_id, {}).pop(unique_id, None)
+        self._entities_by_capability[entity.capability_id].pop(unique_id)
+
+    def _is_entity_changed(self, current_entity: Entity, entity: Entity) -> bool:
+        if current_entity.name != entity.name:
+            return True
+
+        current_signature = self._get_details_signature(current_entity.details)
+        signature = self._get_details_signature(entity.details)
+
+        return current_signature != signature
 
     @staticmethod
-    def _is_binary_sensor(_property_type, has_setter, _has_min_max, options_number) -> bool:
-        return not has_setter and options_number == 2
+    def _get_details_signature(details: dict | None) -> dict | None:
+        if details is None:
+            return None
+
+        signature = {}
+
+        for key in details:
+            value = details[key]
+
+            if isinstance(value, CapabilityEntity):
+                signature[key] = sorted(value.attributes.keys())
+
+            elif isinstance(value, AttributeEntity):
+                default_command = value.default_command
+
+                signature[key] = (
+                    value.properties,
+                    None if default_command is None else default_command.command
+                )
+
+            else:
+                signature[key] = value
+
+        return signature
 
     @staticmethod
-    def _is_sensor(property_type, has_setter, _has_min_max, options_number) -> bool:
-        return not has_setter and (options_number not in [0, 2] or property_type in ["number", "integer", "string"])
+    def _get_indexed_entities(index: dict[str, dict[str, Entity]], key: str) -> list[Entity]:
+        entities = index.get(key, {})
+
+        return list(entities.values())
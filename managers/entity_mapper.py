@@ -0,0 +1,250 @@
+import logging
+
+from helpers.consts import CAPABILITIES_MAPPING_WITH_DEPENDENCY, CAPABILITIES_MAPPING
+from models.attribute import AttributeEntity
+from models.capability import CapabilityEntity
+from models.device import DeviceEntity
+from models.entity import Entity
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class EntityMapper:
+    def __init__(self):
+        self._mapping_index = self._build_mapping_index()
+        self._dependency_index = self._build_dependency_index()
+
+        self._attribute_handlers = {
+            ("powerConsumptionReport", "powerConsumption"): self._map_power_consumption_report
+        }
+
+        self._entity_checks = {
+            "binary_sensor": self._is_binary_sensor,
+            "sensor": self._is_sensor,
+            "number": self._is_number,
+            "select": self._is_select,
+            "switch": self._is_switch,
+            "ignored": self._is_ignored,
+        }
+
+    def map_device(self, device: DeviceEntity) -> list[Entity]:
+        _LOGGER.debug(f"Creating entities of {device.label}")
+
+        entities = []
+
+        for component_id in device.components:
+            component = device.components.get(component_id)
+
+            entities.extend(self.map_component(device, component_id, component.capabilities))
+
+        return entities
+
+    def map_component(
+            self,
+            device: DeviceEntity,
+            component_id: str,
+            component_capabilities: dict[str, CapabilityEntity]
+    ) -> list[Entity]:
+        entities = []
+        mapped_capabilities: dict[str, dict[str, CapabilityEntity]] = {}
+
+        for capability_id in component_capabilities:
+            capability = component_capabilities.get(capability_id)
+
+            for attribute_key in capability.attributes:
+                attribute = capability.attributes.get(attribute_key)
+
+                attribute_entities = self._map_attribute(device, component_id, capability_id, attribute_key, attribute)
+
+                entities.extend(attribute_entities)
+
+            for entity_type in self._mapping_index.get(capability_id, []):
+                mapped_capabilities.setdefault(entity_type, {})[capability_id] = capability
+
+            for entity_type, dependencies in self._dependency_index.get(capability_id, []):
+                relevant_capabilities = {
+                    dependency: component_capabilities[dependency]
+                    for dependency in dependencies
+                    if dependency in component_capabilities
+                }
+
+                if len(relevant_capabilities.keys()) == 0:
+                    continue
+
+                relevant_capabilities[capability_id] = capability
+
+                entity = Entity.load(
+                    device.label,
+                    device.device_id,
+                    component_id,
+                    capability_id,
+                    capability_id,
+                    entity_type,
+                    relevant_capabilities,
+                )
+
+                entities.append(entity)
+
+        for entity_type in mapped_capabilities:
+            relevant_capabilities = mapped_capabilities[entity_type]
+            main_capability_id = next(iter(relevant_capabilities))
+
+            entity = Entity.load(
+                device.label,
+                device.device_id,
+                component_id,
+                main_capability_id,
+                main_capability_id,
+                entity_type,
+                relevant_capabilities,
+            )
+
+            entities.append(entity)
+
+        return entities
+
+    def _map_attribute(
+            self,
+            device: DeviceEntity,
+            component_id: str,
+            capability_id: str,
+            attribute_key: str,
+            attribute: AttributeEntity
+    ) -> list[Entity]:
+        handler = self._attribute_handlers.get((capability_id, attribute_key))
+
+        if handler is not None:
+            entities = handler(device, component_id, capability_id, attribute_key, attribute)
+
+            if entities is not None:
+                return entities
+
+        entity_type = self.get_attribute_entity_type(attribute)
+
+        if entity_type is None:
+            return []
+
+        entity = Entity.load(
+            device.label,
+            device.device_id,
+            component_id,
+            capability_id,
+            attribute_key,
+            entity_type,
+            {attribute_key: attribute},
+        )
+
+        return [entity]
+
+    @staticmethod
+    def _map_power_consumption_report(
+            device: DeviceEntity,
+            component_id: str,
+            capability_id: str,
+            attribute_key: str,
+            attribute: AttributeEntity
+    ) -> list[Entity] | None:
+        attribute_value = attribute.value
+
+        if attribute_value is None:
+            return None
+
+        properties = attribute.properties or {}
+        props = properties.get("properties", {})
+
+        entities = [
+            Entity.load(
+                device.label,
+                device.device_id,
+                component_id,
+                capability_id,
+                f"{attribute_key}.{attribute_sub_key}",
+                "sensor",
+                props.get(attribute_sub_key),
+            )
+            for attribute_sub_key in attribute_value
+        ]
+
+        return entities
+
+    def get_attribute_entity_type(self, attribute: AttributeEntity) -> str | None:
+        options_number = 0
+        has_min_max = False
+
+        has_setter = attribute.default_command is not None
+        property_type = None
+
+        if attribute.properties:
+            property_type = attribute.properties.get("type")
+            options_number = len(attribute.properties.get("enum", []))
+            has_min_max = (
+                ("min" in attribute.properties or "minimum" in attribute.properties)
+                and
+                ("max" in attribute.properties or "maximum" in attribute.properties)
+            )
+
+        entity_type = self.get_entity_type(property_type, has_setter, has_min_max, options_number)
+
+        return entity_type
+
+    def get_entity_type(self, has_properties, has_setter, has_min_max, options_number):
+        for entity_type in self._entity_checks:
+            check = self._entity_checks.get(entity_type)
+            is_match = check(has_properties, has_setter, has_min_max, options_number)
+
+            if is_match:
+                return entity_type
+
+        return None
+
+    @staticmethod
+    def _build_mapping_index() -> dict[str, list[str]]:
+        mapping_index: dict[str, list[str]] = {}
+
+        for entity_type in CAPABILITIES_MAPPING:
+            for capability_id in CAPABILITIES_MAPPING[entity_type]:
+                mapping_index.setdefault(capability_id, []).append(entity_type)
+
+        return mapping_index
+
+    @staticmethod
+    def _build_dependency_index() -> dict[str, list[tuple[str, list[str]]]]:
+        dependency_index: dict[str, list[tuple[str, list[str]]]] = {}
+
+        for entity_type in CAPABILITIES_MAPPING_WITH_DEPENDENCY:
+            mappings = CAPABILITIES_MAPPING_WITH_DEPENDENCY[entity_type]
+
+            for main_capability_id in mappings:
+                dependencies = [
+                    capability_id
+                    for capability_id in mappings[main_capability_id]
+                    if capability_id != main_capability_id
+                ]
+
+                dependency_index.setdefault(main_capability_id, []).append((entity_type, dependencies))
+
+        return dependency_index
+
+    @staticmethod
+    def _is_ignored(property_type, _has_setter, _has_min_max, _options_number) -> bool:
+        return property_type is not None
+
+    @staticmethod
+    def _is_number(property_type, has_setter, has_min_max, _options_number) -> bool:
+        return (has_setter and has_min_max) or property_type in ["number", "integer"]
+
+    @staticmethod
+    def _is_switch(_property_type, has_setter, _has_min_max, options_number) -> bool:
+        return has_setter and options_number == 2
+
+    @staticmethod
+    def _is_select(_property_type, has_setter, _has_min_max, options_number) -> bool:
+        return has_setter and options_number > 2
+
+    @staticmethod
+    def _is_binary_sensor(_property_type, has_setter, _has_min_max, options_number) -> bool:
+        return not has_setter and options_number == 2
+
+    @staticmethod
+    def _is_sensor(property_type, has_setter, _has_min_max, options_number) -> bool:
+        return not has_setter and (options_number not in [0, 2] or property_type in ["number", "integer", "string"])
@@ -0,0 +1,99 @@
+import asyncio
+import logging
+from typing import Callable
+
+from helpers.consts import EVENT_QUEUE_BATCH_SIZE, EVENT_QUEUE_MAX_SIZE
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class EventQueue:
+    def __init__(self, handler: Callable[[tuple, object], None], max_size: int = EVENT_QUEUE_MAX_SIZE):
+        self._handler = handler
+        self._max_size = max_size
+
+        self._pending: dict[tuple, object] = {}
+        self._has_events = asyncio.Event()
+        self._has_space = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+        self._received = 0
+        self._coalesced = 0
+        self._processed = 0
+        self._failed = 0
+
+    @property
+    def size(self) -> int:
+        return len(self._pending)
+
+    async def put(self, key: tuple, value):
+        self._received += 1
+
+        while key not in self._pending and len(self._pending) >= self._max_size:
+            self._has_space.clear()
+
+            await self._has_space.wait()
+
+        if key in self._pending:
+            self._coalesced += 1
+
+        self._pending[key] = value
+        self._has_events.set()
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._consume())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+
+            try:
+                await self._task
+
+            except asyncio.CancelledError:
+                pass
+
+            self._task = None
+
+    async def _consume(self):
+        while True:
+            await self._has_events.wait()
+
+            self._has_events.clear()
+
+            batch_size = 0
+
+            while len(self._pending) > 0:
+                key = next(iter(self._pending))
+                value = self._pending.pop(key)
+
+                try:
+                    self._handler(key, value)
+
+                    self._processed += 1
+
+                except Exception as ex:
+                    self._failed += 1
+
+                    _LOGGER.error(f"Failed to process event, Key: {key}, Error: {ex}")
+
+                self._has_space.set()
+
+                batch_size += 1
+
+                if batch_size >= EVENT_QUEUE_BATCH_SIZE:
+                    batch_size = 0
+
+                    await asyncio.sleep(0)
+
+    def get_diagnostic_details(self) -> dict:
+        data = {
+            "size": self.size,
+            "max_size": self._max_size,
+            "received": self._received,
+            "coalesced": self._coalesced,
+            "processed": self._processed,
+            "failed": self._failed
+        }
+
+        return data
@@ -0,0 +1,122 @@
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    def __init__(self, file_path: str | None = None):
+        _LOGGER.info(f"Initializing response cache, File: {file_path}")
+
+        self._file_path = file_path
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._responses: dict[str, dict] = {}
+
+    async def get(self, key: str) -> dict | None:
+        response = self._responses.get(key)
+
+        if response is None and self._file_path is not None:
+            loop = asyncio.get_running_loop()
+
+            stored_response = await loop.run_in_executor(None, self._load, key)
+
+            if stored_response is not None:
+                response = self._responses.setdefault(key, stored_response)
+
+        return response
+
+    async def set(self, key: str, headers, data: dict | list):
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+
+        if etag is None and last_modified is None:
+            return
+
+        body = json.dumps(data)
+
+        self._responses[key] = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "body": body
+        }
+
+        if self._file_path is not None:
+            loop = asyncio.get_running_loop()
+
+            await loop.run_in_executor(None, self._store, key, etag, last_modified, body)
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+
+                self._connection = None
+
+    def _load(self, key: str) -> dict | None:
+        with self._lock:
+            connection = self._get_connection()
+
+            row = connection.execute(
+                "SELECT etag, last_modified, data FROM responses WHERE key = ?",
+                (key,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        etag, last_modified, body = row
+
+        response = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "body": body
+        }
+
+        return response
+
+    def _store(self, key: str, etag: str | None, last_modified: str | None, body: str):
+        row = (key, etag, last_modified, body)
+
+        with self._lock:
+            connection = self._get_connection()
+
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO responses (key, etag, last_modified, data) VALUES (?, ?, ?, ?)",
+                    row
+                )
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = sqlite3.connect(self._file_path, check_same_thread=False)
+
+            with self._connection:
+                self._connection.execute(
+                    "CREATE TABLE IF NOT EXISTS responses ("
+                    "key TEXT PRIMARY KEY, "
+                    "etag TEXT, "
+                    "last_modified TEXT, "
+                    "data TEXT NOT NULL)"
+                )
+
+        return self._connection
+
+    @staticmethod
+    def get_data(response: dict) -> dict | list:
+        return json.loads(response.get("body"))
+
+    @staticmethod
+    def get_validators(response: dict) -> dict:
+        headers = {}
+
+        if response.get("etag") is not None:
+            headers["If-None-Match"] = response.get("etag")
+
+        if response.get("last_modified") is not None:
+            headers["If-Modified-Since"] = response.get("last_modified")
+
+        return headers
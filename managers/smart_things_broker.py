@@ -1,74 +1,509 @@
-import json
+import asyncio
 import logging
 import os
 import sys
+import time
 
 from aiohttp import ClientSession
 
 from api.capabilities_api import CapabilitiesAPI
 from api.devices_api import DevicesAPI
 from api.locations_api import LocationsAPI
-from helpers.consts import DIAGNOSTIC_FILE
+from helpers.consts import DEFAULT_MAX_CONCURRENCY, DIAGNOSTIC_FILE, SNAPSHOT_VERSION
 from helpers.errors import CommandError
+from helpers.json_file import read_json_file, write_json_file
+from helpers.rate_limiter import RateLimiter
+from helpers.session_factory import SessionStatistics
+from managers.capability_store import CapabilityStore
+from managers.command_debouncer import CommandDebouncer
+from managers.device_registry import DeviceRegistry
 from managers.entity_manager import EntityManager
+from managers.event_queue import EventQueue
+from managers.response_cache import ResponseCache
 from models.device import DeviceEntity
+from models.entity import Entity
 
 _LOGGER = logging.getLogger(__name__)
 
 
 class SmartThingsBroker:
-    def __init__(self, token: str, session: ClientSession, device_capabilities: dict | None = None):
+    def __init__(
+            self,
+            token: str,
+            session: ClientSession,
+            device_capabilities: dict | None = None,
+            max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+            rate_limits: dict[str, dict] | None = None,
+            retry_policy: dict | None = None,
+            circuit_breaker_settings: dict | None = None,
+            capability_store: CapabilityStore | None = None,
+            response_cache: ResponseCache | None = None,
+            debounce_window: float | None = None,
+            lazy: bool = False,
+            capabilities_api: CapabilitiesAPI | None = None,
+            request_timeouts: dict[str, dict] | None = None,
+            session_statistics: SessionStatistics | None = None
+    ):
         _LOGGER.info("Initializing manager")
 
         self._session: ClientSession = session
-
-        self._entity_manager = EntityManager()
-
-        self._capabilities_api = CapabilitiesAPI(token, session, device_capabilities)
-        self._devices_api = DevicesAPI(token, session)
-        self._locations_api = LocationsAPI(token, session)
+        self._session_statistics: SessionStatistics | None = session_statistics
+        self._lazy = lazy
+
+        self._entity_manager = EntityManager(lazy)
+
+        self._rate_limiter = RateLimiter(rate_limits)
+
+        self._is_capabilities_shared = capabilities_api is not None
+
+        self._capabilities_api = capabilities_api if self._is_capabilities_shared else CapabilitiesAPI(
+            token,
+            session,
+            device_capabilities,
+            max_concurrency,
+            self._rate_limiter,
+            retry_policy,
+            circuit_breaker_settings,
+            response_cache,
+            capability_store,
+            request_timeouts
+        )
+
+        self._devices_api = DevicesAPI(
+            token,
+            session,
+            max_concurrency,
+            self._rate_limiter,
+            retry_policy,
+            circuit_breaker_settings,
+            request_timeouts
+        )
+
+        self._locations_api = LocationsAPI(
+            token,
+            session,
+            max_concurrency,
+            self._rate_limiter,
+            retry_policy,
+            circuit_breaker_settings,
+            response_cache,
+            request_timeouts
+        )
 
         self._devices: list[DeviceEntity] | None = None
+        self._device_registry = DeviceRegistry(lazy)
+        self._stages_timing: dict[str, dict] = {}
+        self._reconcile_task: asyncio.Task | None = None
+
+        self._event_queue = EventQueue(self._apply_event)
+        self._command_debouncer = None if not debounce_window else CommandDebouncer(debounce_window)
 
     @property
-    def entities(self) -> list[DeviceEntity] | None:
+    def entities(self) -> list[Entity]:
         return self._entity_manager.entities
 
     @property
     def devices(self) -> list[DeviceEntity] | None:
         return self._devices
 
+    @property
+    def account_key(self) -> str:
+        return self._devices_api.account_key
+
+    @property
+    def stages_timing(self) -> dict[str, dict]:
+        return self._stages_timing
+
+    @property
+    def reconcile_task(self) -> asyncio.Task | None:
+        return self._reconcile_task
+
     async def initialize(self):
         _LOGGER.info("Initializing data")
 
-        await self._capabilities_api.load()
-        await self._devices_api.load()
-        await self._locations_api.load()
+        self._stages_timing = {}
 
-        device_capabilities = self._devices_api.get_device_capabilities()
+        started_at = time.perf_counter()
 
-        await self._capabilities_api.load_details(device_capabilities)
+        await self._load_data(started_at)
 
         _LOGGER.info("Processing imported data")
 
+        stage_started_at = time.perf_counter()
+
+        self._load_devices()
+
+        self._set_stage_timing("processing", started_at, stage_started_at)
+
+        stages_description = ", ".join([
+            f"{stage_name}: {self._stages_timing[stage_name]['duration']:.3f}s"
+            for stage_name in self._stages_timing
+        ])
+
+        _LOGGER.info(
+            f"Data initialized, "
+            f"Duration: {time.perf_counter() - started_at:.3f}s, "
+            f"Stages: {stages_description}"
+        )
+
+    async def warm_start(self, file_path: str) -> bool:
+        is_restored = await self.restore_snapshot(file_path)
+
+        if not is_restored:
+            await self.initialize()
+
+            return False
+
+        self._reconcile_task = asyncio.create_task(self._reconcile())
+
+        return True
+
+    async def restore_snapshot(self, file_path: str) -> bool:
+        _LOGGER.info(f"Restoring snapshot, File: {file_path}")
+
+        if not os.path.exists(file_path):
+            _LOGGER.info(f"Snapshot is not available, File: {file_path}")
+
+            return False
+
+        self._stages_timing = {}
+
+        started_at = time.perf_counter()
+
+        loop = asyncio.get_running_loop()
+
+        try:
+            data = await loop.run_in_executor(None, read_json_file, file_path)
+
+        except (OSError, EOFError, ValueError) as ex:
+            _LOGGER.warning(f"Failed to read snapshot, Error: {ex}, File: {file_path}")
+
+            return False
+
+        snapshot_version = data.get("version")
+
+        if snapshot_version != SNAPSHOT_VERSION:
+            _LOGGER.warning(f"Ignoring snapshot of unsupported version, Version: {snapshot_version}")
+
+            return False
+
+        self._capabilities_api.restore(data.get("device_capabilities", {}))
+        self._devices_api.restore(data.get("devices", []))
+        self._locations_api.restore(data.get("locations", []))
+
+        self._load_devices()
+
+        self._set_stage_timing("snapshot", started_at, started_at)
+
+        _LOGGER.info(
+            f"Snapshot restored, "
+            f"Duration: {time.perf_counter() - started_at:.3f}s, "
+            f"Age: {time.time() - data.get('saved_at', 0):.0f}s, "
+            f"Devices: {len(self._devices)}"
+        )
+
+        return True
+
+    async def save_snapshot(self, file_path: str):
+        _LOGGER.info(f"Storing snapshot, File: {file_path}")
+
+        devices = self._devices_api.devices
+
+        if devices is None:
+            _LOGGER.warning("Snapshot is not available before data is loaded")
+
+            return
+
+        current_device_capabilities = self._capabilities_api.device_capabilities
+        device_capabilities = {} if current_device_capabilities is None else current_device_capabilities
+
+        data = {
+            "version": SNAPSHOT_VERSION,
+            "saved_at": time.time(),
+            "devices": devices,
+            "locations": self._locations_api.locations,
+            "device_capabilities": {
+                capability_id: device_capabilities[capability_id]
+                for capability_id in self._devices_api.get_device_capabilities()
+                if capability_id in device_capabilities
+            }
+        }
+
+        await write_json_file(file_path, data, True, True)
+
+    async def reconcile(self) -> dict[str, list[Entity]]:
+        _LOGGER.info("Reconciling data")
+
+        restored_devices_data = self._devices_api.devices
+
+        restored_devices = {
+            device_data.get("deviceId"): device_data
+            for device_data in restored_devices_data
+        }
+
+        started_at = time.perf_counter()
+
+        try:
+            await self._load_data(started_at)
+
+        except BaseException:
+            self._devices_api.restore(restored_devices_data)
+
+            raise
+
+        stage_started_at = time.perf_counter()
+
+        entities_diff = {
+            "added": [],
+            "removed": [],
+            "changed": []
+        }
+
+        changed_attributes = set()
+        devices = []
+
+        for device_data in self._devices_api.devices:
+            device_id = device_data.get("deviceId")
+            restored_devices.pop(device_id, None)
+
+            current_device = self._device_registry.get_device(device_id)
+            device = DeviceEntity.load(device_data, self._capabilities_api.definitions, self._lazy)
+
+            is_unchanged = (
+                current_device is not None and
+                self._get_device_signature(current_device) == self._get_device_signature(device)
+            )
+
+            if is_unchanged:
+                changed_attributes.update(current_device.update_status(device_data))
+
+                devices.append(current_device)
+
+                continue
+
+            self._device_registry.add_device(device)
+            self._merge_entities_diff(entities_diff, self._entity_manager.upsert_device(device))
+
+            devices.append(device)
+
+        for device_id in restored_devices:
+            current_device = self._device_registry.get_device(device_id)
+
+            if device_id in self._devices_api.failed_devices and current_device is not None:
+                _LOGGER.debug(f"Keeping restored device until its status is available, Device: {device_id}")
+
+                self._devices_api.devices.append(restored_devices[device_id])
+                devices.append(current_device)
+
+                continue
+
+            self._device_registry.remove_device(device_id)
+            self._merge_entities_diff(entities_diff, self._entity_manager.remove_device(device_id))
+
+        self._devices = devices
+
+        self._set_stage_timing("reconcile", started_at, stage_started_at)
+
+        _LOGGER.info(
+            f"Data reconciled, "
+            f"Duration: {time.perf_counter() - started_at:.3f}s, "
+            f"Added: {len(entities_diff['added'])}, "
+            f"Removed: {len(entities_diff['removed'])}, "
+            f"Changed: {len(entities_diff['changed'])}, "
+            f"Changed attributes: {len(changed_attributes)}"
+        )
+
+        return entities_diff
+
+    async def _reconcile(self) -> dict[str, list[Entity]] | None:
+        try:
+            return await self.reconcile()
+
+        except Exception as ex:
+            _LOGGER.error(f"Failed to reconcile data, keeping restored snapshot, Error: {ex}")
+
+        return None
+
+    async def refresh(self) -> set[tuple[str, str, str, str]]:
+        _LOGGER.debug("Refreshing data")
+
+        devices_status = await self._devices_api.refresh()
+
+        changed_attributes = set()
+
+        for device in self._devices:
+            device_status = devices_status.get(device.device_id)
+
+            if device_status is not None:
+                changed_attributes.update(device.update_status(device_status))
+
+        _LOGGER.debug(f"Data refreshed, Changed attributes: {len(changed_attributes)}")
+
+        return changed_attributes
+
+    async def upsert_device(self, device_id: str) -> dict[str, list[Entity]] | None:
+        _LOGGER.info(f"Loading device {device_id}")
+
+        device_data = await self._devices_api.load_device(device_id)
+
+        if device_data is None:
+            return None
+
+        device_capabilities = self._devices_api.get_device_capabilities([device_data])
+
+        await self._capabilities_api.load_details(device_capabilities)
+
+        device = DeviceEntity.load(device_data, self._capabilities_api.definitions, self._lazy)
+
         self._devices = [
-            DeviceEntity.load(device_data, self._capabilities_api.device_capabilities)
+            current_device
+            for current_device in self._devices
+            if current_device.device_id != device_id
+        ]
+
+        self._devices.append(device)
+        self._device_registry.add_device(device)
+
+        return self._entity_manager.upsert_device(device)
+
+    def remove_device(self, device_id: str) -> dict[str, list[Entity]]:
+        _LOGGER.info(f"Removing device {device_id}")
+
+        self._devices_api.remove_device(device_id)
+
+        self._devices = [
+            device
+            for device in self._devices
+            if device.device_id != device_id
+        ]
+
+        self._device_registry.remove_device(device_id)
+
+        return self._entity_manager.remove_device(device_id)
+
+    async def apply_event(
+            self,
+            device_id: str,
+            component_id: str,
+            capability_id: str,
+            attribute: str,
+            value
+    ):
+        await self._event_queue.put((device_id, component_id, capability_id, attribute), value)
+
+    def _apply_event(self, key: tuple[str, str, str, str], value):
+        attribute = self._device_registry.get_attribute(*key)
+
+        if attribute is None:
+            _LOGGER.debug(f"Ignoring event of unknown attribute, Key: {key}")
+
+            return
+
+        attribute.update_value({"value": value})
+
+    async def terminate(self):
+        _LOGGER.info("Terminating manager")
+
+        if self._reconcile_task is not None and not self._reconcile_task.done():
+            self._reconcile_task.cancel()
+
+        await self._event_queue.stop()
+
+        if self._command_debouncer is not None:
+            await self._command_debouncer.cancel()
+
+    async def _load_data(self, started_at: float):
+        stages = {
+            "capabilities": (self._load_capabilities, []),
+            "devices": (self._devices_api.load, []),
+            "locations": (self._locations_api.load, []),
+            "capabilities_details": (self._load_capabilities_details, ["capabilities", "devices"]),
+        }
+
+        await self._run_stages(stages, started_at)
+
+    def _load_devices(self):
+        self._devices = [
+            DeviceEntity.load(device_data, self._capabilities_api.definitions, self._lazy)
             for device_data in self._devices_api.devices
         ]
 
+        self._device_registry.load(self._devices)
+
         self._entity_manager.load(self._devices)
 
+    @staticmethod
+    def _get_device_signature(device: DeviceEntity) -> tuple:
+        components_signature = {
+            component_id: {
+                capability_id: (capability.definition, sorted(capability.attribute_keys))
+                for capability_id, capability in component.capabilities.items()
+            }
+            for component_id, component in device.components.items()
+        }
+
+        return device.label, device.room_id, components_signature
+
+    @staticmethod
+    def _merge_entities_diff(entities_diff: dict[str, list[Entity]], device_entities_diff: dict[str, list[Entity]]):
+        for key in entities_diff:
+            entities_diff[key].extend(device_entities_diff[key])
+
+    async def _load_capabilities(self):
+        if self._is_capabilities_shared and self._capabilities_api.capabilities is not None:
+            _LOGGER.debug("Skipping shared capabilities catalog, already loaded")
+
+            return
+
+        await self._capabilities_api.load()
+
+    async def _load_capabilities_details(self):
+        device_capabilities = self._devices_api.get_device_capabilities()
+
+        await self._capabilities_api.load_details(device_capabilities)
+
+    async def _run_stages(self, stages: dict, started_at: float):
+        tasks: dict[str, asyncio.Task] = {}
+
+        async def _run_stage(stage_name: str, stage_action, dependencies: list[str]):
+            await asyncio.gather(*[tasks[dependency] for dependency in dependencies])
+
+            stage_started_at = time.perf_counter()
+
+            await stage_action()
+
+            self._set_stage_timing(stage_name, started_at, stage_started_at)
+
+        for stage_name in stages:
+            stage_action, stage_dependencies = stages[stage_name]
+
+            tasks[stage_name] = asyncio.create_task(_run_stage(stage_name, stage_action, stage_dependencies))
+
+        try:
+            await asyncio.gather(*tasks.values())
+
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+            raise
+
+    def _set_stage_timing(self, stage_name: str, started_at: float, stage_started_at: float):
+        stage_ended_at = time.perf_counter()
+
+        self._stages_timing[stage_name] = {
+            "start": stage_started_at - started_at,
+            "end": stage_ended_at - started_at,
+            "duration": stage_ended_at - stage_started_at
+        }
+
     def get_entities(self, entity_type: str):
         return self._entity_manager.get_entities(entity_type)
 
-    def _get_device(self, device_id):
-        devices = [
-            device
-            for device in self.devices
-            if device.device_id == device_id
-        ]
-
-        return None if len(devices) == 0 else devices[0]
+    def get_entity(self, unique_id: str) -> Entity | None:
+        return self._entity_manager.get_entity(unique_id)
 
     async def send_command(
             self,
@@ -79,47 +514,97 @@ class SmartThingsBroker:
             args: list | None = None
     ) -> bool:
 
-        result = False
+        if self._command_debouncer is None:
+            return await self._send_command(device_id, component_id, capability_id, command, args)
 
-        command_parts = {
-            "Device": device_id,
-            "Component": component_id,
-            "Capability": capability_id,
-            "Command": command,
-        }
+        command_data = self._devices_api.get_command_data(component_id, capability_id, command, args)
 
-        param_parts = [
-            f"{command_part}: {command_parts[command_part]}"
-            for command_part in command_parts
-        ]
+        if not self._validate_command(device_id, command_data):
+            return False
 
-        params_description = ", ".join(param_parts)
+        result = await self._command_debouncer.debounce(
+            (device_id, component_id, capability_id, command),
+            args,
+            lambda debounced_args: self._send_command(device_id, component_id, capability_id, command, debounced_args)
+        )
 
-        try:
-            _LOGGER.debug(f"Sending command, Params: {params_description}")
+        return result
 
-            device = self._get_device(device_id)
+    async def _send_command(
+            self,
+            device_id: str,
+            component_id: str,
+            capability_id: str,
+            command: str,
+            args: list | None = None
+    ) -> bool:
+        command_data = self._devices_api.get_command_data(component_id, capability_id, command, args)
 
-            if device is None:
-                raise CommandError(f"Device is not available")
+        results = await self.send_commands(device_id, [command_data])
 
-            device.validate_command(component_id, capability_id, command, args)
+        return results[0]
 
-            result = await self._devices_api.send_command(
-                device_id,
-                component_id,
-                capability_id,
-                command,
-                args
-            )
+    async def send_commands(self, device_id: str, commands: list[dict]) -> list[bool]:
+        results = [False for _ in commands]
+        valid_commands: dict[int, dict] = {}
+
+        for i, command_data in enumerate(commands):
+            if self._validate_command(device_id, command_data):
+                valid_commands[i] = command_data
+
+        if len(valid_commands) == 0:
+            return results
+
+        sent_results = await self._devices_api.send_commands(device_id, list(valid_commands.values()))
+
+        for i, result in zip(valid_commands, sent_results):
+            results[i] = result
 
             if result:
+                params_description = self._get_command_description(device_id, valid_commands[i])
+
                 _LOGGER.info(f"Command sent successfully, Params: {params_description}")
 
+        return results
+
+    def _validate_command(self, device_id: str, command_data: dict) -> bool:
+        params_description = self._get_command_description(device_id, command_data)
+
+        try:
+            _LOGGER.debug(f"Sending command, Params: {params_description}")
+
+            self._device_registry.validate_command(
+                device_id,
+                command_data.get("component"),
+                command_data.get("capability"),
+                command_data.get("command"),
+                command_data.get("args")
+            )
+
+            return True
+
         except CommandError as ex:
             _LOGGER.error(f"Failed to send command, Error: {ex.message}, Params: {params_description}")
 
-        return result
+        return False
+
+    @staticmethod
+    def _get_command_description(device_id: str, command_data: dict) -> str:
+        command_parts = {
+            "Device": device_id,
+            "Component": command_data.get("component"),
+            "Capability": command_data.get("capability"),
+            "Command": command_data.get("command"),
+        }
+
+        param_parts = [
+            f"{command_part}: {command_parts[command_part]}"
+            for command_part in command_parts
+        ]
+
+        params_description = ", ".join(param_parts)
+
+        return params_description
 
     def get_diagnostic_details(self) -> dict:
         _LOGGER.info("Retrieving diagnostic details")
@@ -127,6 +612,7 @@ class SmartThingsBroker:
         data = {
             "api": {
                 "devices": self._devices_api.devices,
+                "failed_devices": self._devices_api.failed_devices,
                 "capabilities": self._capabilities_api.capabilities,
                 "device_capabilities": self._capabilities_api.device_capabilities,
                 "locations": self._locations_api.locations
@@ -134,17 +620,31 @@ class SmartThingsBroker:
             "data": {
                 "devices": self.devices,
                 "entities": self.entities
-            }
+            },
+            "stages_timing": self.stages_timing,
+            "rate_limits": self._rate_limiter.get_diagnostic_details(),
+            "events": self._event_queue.get_diagnostic_details(),
+            "commands": None if self._command_debouncer is None else self._command_debouncer.get_diagnostic_details(),
+            "requests": self.get_requests_details(),
+            "session": None if self._session_statistics is None else self._session_statistics.get_diagnostic_details()
+        }
+
+        return data
+
+    def get_requests_details(self) -> dict[str, dict]:
+        data = {
+            str(api.endpoint): api.get_diagnostic_details()
+            for api in [self._capabilities_api, self._devices_api, self._locations_api]
         }
 
         return data
 
-    def save_diagnostic_details(self):
+    async def save_diagnostic_details(self, compress: bool = False, compact: bool = False):
         _LOGGER.info("Storing diagnostic details")
 
         data = self.get_diagnostic_details()
 
-        file_path = os.path.join(sys.path[1], "data", DIAGNOSTIC_FILE)
+        file_name = f"{DIAGNOSTIC_FILE}.gz" if compress else DIAGNOSTIC_FILE
+        file_path = os.path.join(sys.path[1], "data", file_name)
 
-        with open(file_path, "w+") as f:
-            f.write(json.dumps(data, default=lambda o: o.__dict__, sort_keys=True, indent=4))
+        await write_json_file(file_path, data, compress, compact)
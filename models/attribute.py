@@ -1,37 +1,51 @@
 import logging
-from copy import copy
 
+from models.capability_definition import AttributeDefinition, EMPTY_ATTRIBUTE_DEFINITION
 from models.command import CommandEntity
 
 _LOGGER = logging.getLogger(__name__)
 
 
 class AttributeEntity:
+    __slots__ = ("value", "definition")
+
     def __init__(self):
-        self.value: str | None = None
-        self.default_command: dict | None = None
         self.value: str | dict | list | float | int | None = None
-        self.properties: dict | None = None
+        self.definition: AttributeDefinition = EMPTY_ATTRIBUTE_DEFINITION
 
-    @staticmethod
-    def load(data: dict, capability_attribute: dict, commands: list[CommandEntity] | None):
-        _LOGGER.debug(f"Loading attribute, Data: {data}")
+    @property
+    def default_command(self) -> CommandEntity | None:
+        return self.definition.default_command
 
-        entity = AttributeEntity()
-        entity.value = data.get("value")
+    @property
+    def properties(self) -> dict | None:
+        return self.definition.properties
+
+    def update_value(self, data: dict) -> bool:
+        value = data.get("value")
+
+        if value == self.value:
+            return False
 
-        if capability_attribute is not None:
-            schema = capability_attribute.get("schema", {})
-            command_name = capability_attribute.get("setter")
+        self.value = value
 
-            default_command = [
-                copy(command)
-                for command in commands
-                if command_name is not None and command.command == command_name
-            ]
+        return True
 
-            entity.properties = schema.get("properties", {}).get("value")
+    def to_dict(self) -> dict:
+        data = {
+            "value": self.value,
+            "default_command": None if self.default_command is None else self.default_command.to_dict(),
+            "properties": self.properties
+        }
 
-            entity.default_command = None if len(default_command) == 0 else default_command[0]
+        return data
+
+    @staticmethod
+    def load(data: dict, definition: AttributeDefinition):
+        _LOGGER.debug(f"Loading attribute, Data: {data}")
+
+        entity = AttributeEntity()
+        entity.value = data.get("value")
+        entity.definition = definition
 
         return entity
@@ -2,31 +2,54 @@ import logging
 
 from helpers.errors import CommandError
 from models.attribute import AttributeEntity
+from models.capability_definition import CapabilityDefinition
 from models.command import CommandEntity
 
 _LOGGER = logging.getLogger(__name__)
 
 
 class CapabilityEntity:
+    __slots__ = ("definition", "_attributes", "_data")
+
     def __init__(self):
-        self.name: str | None = None
-        self.status: str | None = None
-        self.name: str | None = None
-        self.attributes: dict[str, AttributeEntity] | None = None
-        self.commands: list[CommandEntity] | None = None
+        self.definition: CapabilityDefinition | None = None
+        self._attributes: dict[str, AttributeEntity] | None = None
+        self._data: dict | None = None
+
+    @property
+    def attributes(self) -> dict[str, AttributeEntity]:
+        if self._attributes is None:
+            self._attributes = self._load_attributes(self._data)
+            self._data = None
+
+        return self._attributes
+
+    @property
+    def attribute_keys(self) -> list[str]:
+        return list(self._data if self._attributes is None else self._attributes)
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._attributes is not None
+
+    @property
+    def name(self) -> str | None:
+        return self.definition.name
+
+    @property
+    def status(self) -> str | None:
+        return self.definition.status
+
+    @property
+    def commands(self) -> dict[str, CommandEntity]:
+        return self.definition.commands
 
     def validate_command(self, command: str, args: list | None = None):
-        commands = [
-            command_item
-            for command_item in self.commands
-            if command_item.command == command
-        ]
+        command_item = self.commands.get(command)
 
-        if not any(commands):
+        if command_item is None:
             raise CommandError(f"Command is not available")
 
-        command_item = commands[0]
-
         command_item.validate_command(args)
 
     def get_disabled_components(self) -> list[str]:
@@ -45,33 +68,71 @@ class CapabilityEntity:
 
         return attribute.value
 
-    @staticmethod
-    def load(data: dict, device_capability: dict):
-        _LOGGER.debug(f"Loading capability, Data: {data}")
+    def update_status(self, data: dict) -> set[str]:
+        if self._attributes is None:
+            return self._update_data(data)
 
-        entity = CapabilityEntity()
+        changed_attributes = set()
+
+        for attribute_key in data:
+            attribute = self.attributes.get(attribute_key)
 
-        entity.name = device_capability.get("name")
-        entity.status = device_capability.get("status")
-        entity.attributes = {}
+            if attribute is not None and attribute.update_value(data[attribute_key]):
+                changed_attributes.add(attribute_key)
 
-        commands = device_capability.get("commands")
+        return changed_attributes
 
-        entity.commands = [
-            CommandEntity.load({
-                "command": command_key,
-                "arguments": commands[command_key].get("arguments")
-            })
-            for command_key in commands
-        ]
+    def _update_data(self, data: dict) -> set[str]:
+        changed_data = {}
 
         for attribute_key in data:
-            device_attribute = data.get(attribute_key)
-            device_capability_attribute = device_capability.get("attributes")
-            capability_attribute = device_capability_attribute.get(attribute_key)
+            attribute_data = self._data.get(attribute_key)
+            value = data[attribute_key].get("value")
+
+            if attribute_data is not None and attribute_data.get("value") != value:
+                changed_data[attribute_key] = {**attribute_data, "value": value}
+
+        if len(changed_data) > 0:
+            self._data = {**self._data, **changed_data}
+
+        return set(changed_data.keys())
+
+    def _load_attributes(self, data: dict) -> dict[str, AttributeEntity]:
+        attributes = {
+            attribute_key: AttributeEntity.load(data[attribute_key], self.definition.get_attribute(attribute_key))
+            for attribute_key in data
+        }
+
+        return attributes
+
+    def to_dict(self) -> dict:
+        data = {
+            "name": self.name,
+            "status": self.status,
+            "attributes": {
+                attribute_key: self.attributes[attribute_key].to_dict()
+                for attribute_key in self.attributes
+            },
+            "commands": {
+                command_key: self.commands[command_key].to_dict()
+                for command_key in self.commands
+            }
+        }
+
+        return data
+
+    @staticmethod
+    def load(data: dict, definition: CapabilityDefinition, lazy: bool = False):
+        _LOGGER.debug(f"Loading capability, Data: {data}, Lazy: {lazy}")
+
+        entity = CapabilityEntity()
+
+        entity.definition = definition
+
+        if lazy:
+            entity._data = data
 
-            entity.attributes[attribute_key] = AttributeEntity.load(device_attribute,
-                                                                    capability_attribute,
-                                                                    entity.commands)
+        else:
+            entity._attributes = entity._load_attributes(data)
 
         return entity
@@ -0,0 +1,72 @@
+import logging
+
+from models.command import CommandEntity
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AttributeDefinition:
+    __slots__ = ("properties", "default_command")
+
+    def __init__(self):
+        self.properties: dict | None = None
+        self.default_command: CommandEntity | None = None
+
+    @staticmethod
+    def load(capability_attribute: dict, commands: dict[str, CommandEntity]):
+        definition = AttributeDefinition()
+
+        schema = capability_attribute.get("schema", {})
+        command_name = capability_attribute.get("setter")
+
+        definition.properties = schema.get("properties", {}).get("value")
+        definition.default_command = None if command_name is None else commands.get(command_name)
+
+        return definition
+
+
+EMPTY_ATTRIBUTE_DEFINITION = AttributeDefinition()
+
+
+class CapabilityDefinition:
+    __slots__ = ("capability_id", "version", "name", "status", "commands", "attributes")
+
+    def __init__(self):
+        self.capability_id: str | None = None
+        self.version: str | None = None
+        self.name: str | None = None
+        self.status: str | None = None
+        self.commands: dict[str, CommandEntity] | None = None
+        self.attributes: dict[str, AttributeDefinition] | None = None
+
+    def get_attribute(self, attribute_key: str) -> AttributeDefinition:
+        return self.attributes.get(attribute_key, EMPTY_ATTRIBUTE_DEFINITION)
+
+    @staticmethod
+    def load(device_capability: dict):
+        _LOGGER.debug(f"Loading capability definition, Capability: {device_capability.get('id')}")
+
+        definition = CapabilityDefinition()
+
+        definition.capability_id = device_capability.get("id")
+        definition.version = str(device_capability.get("version"))
+        definition.name = device_capability.get("name")
+        definition.status = device_capability.get("status")
+
+        commands = device_capability.get("commands", {})
+        capability_attributes = device_capability.get("attributes", {})
+
+        definition.commands = {
+            command_key: CommandEntity.load({
+                "command": command_key,
+                "arguments": commands[command_key].get("arguments")
+            })
+            for command_key in commands
+        }
+
+        definition.attributes = {
+            attribute_key: AttributeDefinition.load(capability_attributes[attribute_key], definition.commands)
+            for attribute_key in capability_attributes
+        }
+
+        return definition
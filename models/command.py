@@ -1,41 +1,29 @@
 import logging
 
-from helpers.command_validators import ARGUMENT_VALIDATORS
-from helpers.errors import CommandError
+from helpers.command_validators import CommandValidator, compile_command_validator
 
 _LOGGER = logging.getLogger(__name__)
 
 
 class CommandEntity:
+    __slots__ = ("command", "arguments", "_validator")
+
     def __init__(self):
         self.command: str | None = None
         self.arguments: list[dict] | None = None
 
-    def validate_command(self, args: list | None = None):
-        expected_args = len(self.arguments)
-        received_args = 0 if args is None else len(args)
-
-        if expected_args != received_args:
-            error_message = (
-                f"Command was expecting {expected_args} argument, "
-                f"{received_args} were received"
-            )
-
-            raise CommandError(error_message)
+        self._validator: CommandValidator | None = None
 
-        for i in range(0, received_args):
-            arg_data = self.arguments[i]
-            arg_input = args[i]
-
-            schema = arg_data.get("schema", {})
-            arg_name = arg_data.get("name")
-
-            arg_type = schema.get("type")
+    def validate_command(self, args: list | None = None):
+        self._validator(args)
 
-            validate = ARGUMENT_VALIDATORS.get(arg_type)
+    def to_dict(self) -> dict:
+        data = {
+            "command": self.command,
+            "arguments": self.arguments
+        }
 
-            if validate is not None:
-                validate(arg_name, schema, arg_input)
+        return data
 
     @staticmethod
     def load(data: dict):
@@ -45,4 +33,6 @@ class CommandEntity:
         entity.command = data.get("command")
         entity.arguments = data.get("arguments")
 
+        entity._validator = compile_command_validator(entity.arguments)
+
         return entity
@@ -4,14 +4,38 @@ from copy import copy
 from helpers.enums import SystemAttribute
 from helpers.errors import CommandError
 from models.capability import CapabilityEntity
+from models.capability_definition import CapabilityDefinition
 
 _LOGGER = logging.getLogger(__name__)
 
 
 class ComponentEntity:
+    __slots__ = ("_capabilities", "_disabled_capabilities", "_source")
+
     def __init__(self):
-        self.capabilities: dict[str, CapabilityEntity] | None = None
-        self.disabled_capabilities: list[str] | None = None
+        self._capabilities: dict[str, CapabilityEntity] | None = None
+        self._disabled_capabilities: list[str] | None = None
+        self._source: tuple[dict, dict, bool] | None = None
+
+    @property
+    def capabilities(self) -> dict[str, CapabilityEntity]:
+        if self._capabilities is None:
+            self._load_capabilities(*self._source, True)
+            self._source = None
+
+        return self._capabilities
+
+    @property
+    def disabled_capabilities(self) -> list[str]:
+        if self._capabilities is None:
+            self._load_capabilities(*self._source, True)
+            self._source = None
+
+        return self._disabled_capabilities
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._capabilities is not None
 
     def validate_command(self, capability_id: str, command: str, args: list | None = None):
         capability = self.capabilities.get(capability_id)
@@ -32,25 +56,58 @@ class ComponentEntity:
 
         return capability.get_value(attribute_key)
 
-    @staticmethod
-    def load(data: dict, device_capabilities: dict, ignore_system_attributes: bool = True):
-        _LOGGER.debug(f"Loading component, Data: {data}")
+    def update_status(self, data: dict) -> set[tuple[str, str]]:
+        changed_attributes = set()
 
-        component = ComponentEntity()
-        component.capabilities = {}
+        for capability_id in data:
+            capability = self.capabilities.get(capability_id)
+
+            if capability is None:
+                continue
+
+            for attribute_key in capability.update_status(data[capability_id]):
+                changed_attributes.add((capability_id, attribute_key))
+
+        return changed_attributes
+
+    def to_dict(self) -> dict:
+        data = {
+            "capabilities": {
+                capability_id: self.capabilities[capability_id].to_dict()
+                for capability_id in self.capabilities
+            },
+            "disabled_capabilities": self.disabled_capabilities
+        }
+
+        return data
+
+    def _load_capabilities(
+            self,
+            data: dict,
+            definitions: dict[str, CapabilityDefinition],
+            ignore_system_attributes: bool,
+            lazy: bool
+    ):
+        capabilities = {}
 
         for capability_id in data:
             capability_data = data[capability_id]
-            device_capability = device_capabilities.get(capability_id)
+            definition = definitions.get(capability_id)
 
-            capability: CapabilityEntity = CapabilityEntity.load(capability_data, device_capability)
+            if definition is None:
+                _LOGGER.warning(f"Ignoring capability without definition, Capability: {capability_id}")
+
+                continue
+
+            capability: CapabilityEntity = CapabilityEntity.load(capability_data, definition, lazy)
 
             if capability.status == "live" or capability_id.startswith("custom."):
-                component.capabilities[capability_id] = capability
+                capabilities[capability_id] = capability
 
-        component.disabled_capabilities = component.get_system_attribute(SystemAttribute.DISABLED_CAPABILITIES)
+        self._capabilities = capabilities
+        self._disabled_capabilities = self.get_system_attribute(SystemAttribute.DISABLED_CAPABILITIES)
 
-        ignored_capabilities = copy(component.disabled_capabilities)
+        ignored_capabilities = copy(self._disabled_capabilities)
 
         if ignore_system_attributes:
             ignored_system_capabilities = [
@@ -62,7 +119,24 @@ class ComponentEntity:
             ignored_capabilities.extend(ignored_system_capabilities)
 
         for capability_id in ignored_capabilities:
-            if capability_id in component.capabilities:
-                del component.capabilities[capability_id]
+            if capability_id in capabilities:
+                del capabilities[capability_id]
+
+    @staticmethod
+    def load(
+            data: dict,
+            definitions: dict[str, CapabilityDefinition],
+            ignore_system_attributes: bool = True,
+            lazy: bool = False
+    ):
+        _LOGGER.debug(f"Loading component, Data: {data}, Lazy: {lazy}")
+
+        component = ComponentEntity()
+
+        if lazy:
+            component._source = (data, definitions, ignore_system_attributes)
+
+        else:
+            component._load_capabilities(data, definitions, ignore_system_attributes, False)
 
         return component
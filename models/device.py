@@ -2,12 +2,24 @@ import logging
 
 from helpers.enums import SystemAttribute
 from helpers.errors import CommandError
+from models.capability_definition import CapabilityDefinition
 from models.component import ComponentEntity
 
 _LOGGER = logging.getLogger(__name__)
 
 
 class DeviceEntity:
+    __slots__ = (
+        "device_id",
+        "label",
+        "manufacturer_name",
+        "device_manufacturer_code",
+        "owner_id",
+        "room_id",
+        "components",
+        "disabled_components"
+    )
+
     def __init__(self):
         self.device_id: str | None = None
         self.label: str | None = None
@@ -26,9 +38,42 @@ class DeviceEntity:
 
         component.validate_command(capability_id, command, args)
 
+    def update_status(self, data: dict) -> set[tuple[str, str, str, str]]:
+        changed_attributes = set()
+
+        device_components = data.get("components", {})
+
+        for component_id in device_components:
+            component = self.components.get(component_id)
+
+            if component is None:
+                continue
+
+            for capability_id, attribute_key in component.update_status(device_components[component_id]):
+                changed_attributes.add((self.device_id, component_id, capability_id, attribute_key))
+
+        return changed_attributes
+
+    def to_dict(self) -> dict:
+        data = {
+            "device_id": self.device_id,
+            "label": self.label,
+            "manufacturer_name": self.manufacturer_name,
+            "device_manufacturer_code": self.device_manufacturer_code,
+            "owner_id": self.owner_id,
+            "room_id": self.room_id,
+            "components": {
+                component_id: self.components[component_id].to_dict()
+                for component_id in self.components
+            },
+            "disabled_components": self.disabled_components
+        }
+
+        return data
+
     @staticmethod
-    def load(data: dict, device_capabilities: dict):
-        _LOGGER.debug(f"Loading device, Data: {data}")
+    def load(data: dict, definitions: dict[str, CapabilityDefinition], lazy: bool = False):
+        _LOGGER.debug(f"Loading device, Data: {data}, Lazy: {lazy}")
 
         device = DeviceEntity()
         device.device_id = data.get("deviceId")
@@ -44,8 +89,9 @@ class DeviceEntity:
 
         main_component = ComponentEntity.load(
             main_component_data,
-            device_capabilities,
-            False
+            definitions,
+            False,
+            lazy
         )
 
         device.disabled_components = main_component.get_system_attribute(SystemAttribute.DISABLED_COMPONENTS)
@@ -53,7 +99,8 @@ class DeviceEntity:
         device.components = {
             component_id: ComponentEntity.load(
                 device_components.get(component_id),
-                device_capabilities
+                definitions,
+                lazy=lazy
             )
             for component_id in device_components
             if component_id not in device.disabled_components
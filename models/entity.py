@@ -1,5 +1,17 @@
 
 class Entity:
+    __slots__ = (
+        "type",
+        "details",
+        "device_id",
+        "device_name",
+        "component_id",
+        "capability_id",
+        "attribute_id",
+        "_name",
+        "_unique_id"
+    )
+
     def __init__(self):
         self.type: str | None = None
         self.details: dict | None = None
@@ -9,13 +21,49 @@ class Entity:
         self.capability_id: dict | None = None
         self.attribute_id: dict | None = None
 
+        self._name: str | None = None
+        self._unique_id: str | None = None
+
     @property
     def name(self):
-        return f"{self.device_name} {self.component_id} {self.capability_id} {self.attribute_id}"
+        return self._name
 
     @property
     def unique_id(self):
-        return f"{self.type}::{self.device_id}.{self.component_id}.{self.capability_id}.{self.attribute_id}"
+        return self._unique_id
+
+    def to_dict(self) -> dict:
+        details = self.details
+
+        if details is not None:
+            details = {
+                key: details[key].to_dict() if hasattr(details[key], "to_dict") else details[key]
+                for key in details
+            }
+
+        data = {
+            "type": self.type,
+            "details": details,
+            "device_id": self.device_id,
+            "device_name": self.device_name,
+            "component_id": self.component_id,
+            "capability_id": self.capability_id,
+            "attribute_id": self.attribute_id,
+            "name": self.name,
+            "unique_id": self.unique_id
+        }
+
+        return data
+
+    @staticmethod
+    def get_unique_id(
+            entity_type: str,
+            device_id: str,
+            component_id: str,
+            capability_id: str,
+            attribute_id: str
+    ) -> str:
+        return f"{entity_type}::{device_id}.{component_id}.{capability_id}.{attribute_id}"
 
     @staticmethod
     def load(
@@ -39,4 +87,7 @@ class Entity:
         entity.capability_id = capability_id
         entity.attribute_id = attribute_id
 
+        entity._name = f"{device_name} {component_id} {capability_id} {attribute_id}"
+        entity._unique_id = Entity.get_unique_id(entity_type, device_id, component_id, capability_id, attribute_id)
+
         return entity
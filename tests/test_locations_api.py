@@ -0,0 +1,57 @@
+import asyncio
+
+from api.locations_api import LocationsAPI
+from helpers.consts import API_BASE
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.status = 200
+        self.headers = {}
+        self._data = data
+
+    def raise_for_status(self):
+        pass
+
+    async def json(self):
+        return self._data
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+
+class FakeSession:
+    def __init__(self, responses: dict[str, dict]):
+        self._responses = responses
+
+    def request(self, method: str, url: str, **kwargs):
+        return FakeResponse(self._responses[url])
+
+
+def load_locations(responses: dict[str, dict]) -> list:
+    locations_api = LocationsAPI("token", FakeSession(responses))
+
+    asyncio.run(locations_api.load())
+
+    return locations_api.locations
+
+
+def test_load_locations_with_null_rooms():
+    locations = load_locations({
+        f"{API_BASE}locations": {"items": [{"locationId": "l1", "name": "Home"}]},
+        f"{API_BASE}locations/l1": {"locationId": "l1", "name": "Home", "latitude": 1},
+        f"{API_BASE}locations/l1/rooms": {"items": None}
+    })
+
+    assert locations == [{"locationId": "l1", "name": "Home", "latitude": 1, "rooms": []}]
+
+
+def test_load_locations_with_null_items():
+    locations = load_locations({
+        f"{API_BASE}locations": {"items": None}
+    })
+
+    assert locations == []
@@ -0,0 +1,23 @@
+import pytest
+
+from models.attribute import AttributeEntity
+from models.capability import CapabilityEntity
+from models.capability_definition import AttributeDefinition, CapabilityDefinition
+from models.command import CommandEntity
+from models.component import ComponentEntity
+from models.device import DeviceEntity
+from models.entity import Entity
+
+
+@pytest.mark.parametrize("model_class", [
+    AttributeEntity,
+    AttributeDefinition,
+    CapabilityDefinition,
+    CapabilityEntity,
+    CommandEntity,
+    ComponentEntity,
+    DeviceEntity,
+    Entity
+])
+def test_model_has_no_instance_dict(model_class):
+    assert not hasattr(model_class(), "__dict__")